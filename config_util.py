@@ -1,31 +1,141 @@
 #!/usr/bin/env python3
 """Utility functions for persisting simple user configuration (integration key, base URL).
 Configuration is stored as JSON in ~/.ebanx_ptp_tester/config.json.
+
+The file is written as compact JSON; set EB_TESTER_PRETTY_CONFIG=1 to get an
+indented file for debugging.
 """
 from __future__ import annotations
 
+import copy
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional – fall back to the stdlib encoder
+    orjson = None
 
 CONFIG_DIR = Path.home() / ".ebanx_ptp_tester"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
+# Plain-str copies of the paths above for the read/write hot path; the Path
+# constants are kept for callers that import them.
+_CONFIG_DIR_STR = os.fspath(CONFIG_DIR)
+_CONFIG_FILE_STR = os.fspath(CONFIG_FILE)
+_CONFIG_TMP_STR = _CONFIG_FILE_STR + ".tmp"
 
-def load_config() -> Dict[str, Any]:
-    """Return stored config or an empty dict if file not found/corrupt."""
+_PRETTY = os.environ.get("EB_TESTER_PRETTY_CONFIG") == "1"
+
+# (st_mtime_ns, st_size, parsed config) of the last read/write so repeat
+# callers skip the re-read + parse while the file is unchanged on disk.
+_CACHE: Optional[Tuple[int, int, Dict[str, Any]]] = None
+# Raw bytes currently on disk (as last read or written) – lets save_config
+# skip rewriting a config that has not actually changed.
+_CACHE_PAYLOAD: Optional[bytes] = None
+# Set once CONFIG_DIR is known to exist, so the mkdir runs once per process
+_DIR_READY = False
+
+
+def _dumps(cfg: Dict[str, Any]) -> bytes:
+    """Serialize *cfg* to UTF-8 JSON bytes using the fastest available encoder."""
+    if orjson is not None:
+        return orjson.dumps(cfg, option=orjson.OPT_INDENT_2 if _PRETTY else None)
+    if _PRETTY:
+        return json.dumps(cfg, indent=2).encode("utf-8")
+    return json.dumps(cfg, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Parse UTF-8 JSON *data* using the fastest available decoder."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _open_tmp() -> int:
+    """Open the temp config file for writing, creating CONFIG_DIR on first use."""
+    global _DIR_READY
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    if not _DIR_READY:
+        os.makedirs(_CONFIG_DIR_STR, exist_ok=True)
+        _DIR_READY = True
     try:
-        with CONFIG_FILE.open("r", encoding="utf-8") as fh:
-            return json.load(fh)
+        return os.open(_CONFIG_TMP_STR, flags, 0o600)
     except FileNotFoundError:
+        # Directory was removed since we created it – recreate and retry once
+        os.makedirs(_CONFIG_DIR_STR, exist_ok=True)
+        return os.open(_CONFIG_TMP_STR, flags, 0o600)
+
+
+def load_config() -> Dict[str, Any]:
+    """Return stored config or an empty dict if file not found/corrupt.
+
+    The parsed result is memoized against the file's mtime and size, so the
+    file is only re-read when it has changed since the last load/save.
+    """
+    global _CACHE, _CACHE_PAYLOAD
+    try:
+        st = os.stat(_CONFIG_FILE_STR)
+    except OSError:
+        _CACHE = _CACHE_PAYLOAD = None
         return {}
-    except (OSError, json.JSONDecodeError):
-        # Corrupt or unreadable – start fresh
+
+    if _CACHE is not None and _CACHE[:2] == (st.st_mtime_ns, st.st_size):
+        return copy.deepcopy(_CACHE[2])
+
+    try:
+        # A single open/fstat/read/close – the file is small enough to be
+        # pulled in with one read, without a buffered file object.
+        fd = os.open(_CONFIG_FILE_STR, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            buf = os.read(fd, st.st_size)
+        finally:
+            os.close(fd)
+    except OSError:
         return {}
 
+    try:
+        cfg = _loads(buf) if buf else {}
+    except ValueError:
+        # Corrupt – start fresh
+        cfg = {}
+
+    _CACHE = (st.st_mtime_ns, st.st_size, cfg)
+    _CACHE_PAYLOAD = buf
+    return copy.deepcopy(cfg)
+
 
 def save_config(cfg: Dict[str, Any]) -> None:
-    """Persist *cfg* to disk. Creates parent directory if needed."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    with CONFIG_FILE.open("w", encoding="utf-8") as fh:
-        json.dump(cfg, fh, indent=2) 
\ No newline at end of file
+    """Persist *cfg* to disk atomically. Creates parent directory if needed."""
+    global _CACHE, _CACHE_PAYLOAD
+    payload = _dumps(cfg)
+
+    # Nothing to do if the bytes on disk are already exactly these
+    if payload == _CACHE_PAYLOAD and _CACHE is not None:
+        try:
+            st = os.stat(_CONFIG_FILE_STR)
+        except OSError:
+            pass
+        else:
+            if _CACHE[:2] == (st.st_mtime_ns, st.st_size):
+                return
+
+    # Write to a sibling temp file, fsync once and atomically rename it over
+    # the real config so a crash mid-save can never leave a truncated file.
+    fd = _open_tmp()
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(_CONFIG_TMP_STR, _CONFIG_FILE_STR)
+    # Prime the cache so the writer never re-reads its own output
+    st = os.stat(_CONFIG_FILE_STR)
+    _CACHE = (st.st_mtime_ns, st.st_size, copy.deepcopy(cfg))
+    _CACHE_PAYLOAD = payload
@@ -16,17 +16,23 @@ from __future__ import annotations
 
 import json
 import os
+import shlex
 import sys
+import threading
 import traceback
-import copy  # NEW: for deep copying payload structures
-import webbrowser  # NEW: for opening 3DS URLs
 from datetime import datetime
-from typing import Dict, List, Optional
-
-import requests
-# Added: QObject, Signal, QThread for async API worker
-from PySide6.QtCore import Qt, QObject, Signal, QThread
-from PySide6.QtGui import QTextOption, QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QFontDatabase
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional
+
+if TYPE_CHECKING:  # requests is imported lazily, on the first API call
+    import requests
+# QObject/Signal + QRunnable/QThreadPool for the async API worker
+from PySide6.QtCore import (
+    Qt, QObject, Signal, QRunnable, QThreadPool, QTimer, QSignalBlocker,
+    QSortFilterProxyModel, QStringListModel, QRegularExpression, QUrl,
+)
+from PySide6.QtGui import QTextOption, QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QFontDatabase, QFontMetricsF, QTextCursor, QTextDocument, QDesktopServices
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -45,19 +51,41 @@ from PySide6.QtWidgets import (
     QSplitter,       # NEW: For resizable panels
     QCheckBox,      # NEW: For soft descriptor checkbox
     QTabWidget,     # NEW: For tab-based interface
+    QFileDialog,
 )
 
+try:
+    import orjson
+except ImportError:  # orjson is optional – fall back to the stdlib encoder
+    orjson = None
+
 # Persistent config helper
 from config_util import load_config, save_config
 
 # ---------------------------------------------------------------------------
 # Logging System
 # ---------------------------------------------------------------------------
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+
+# Background listener that owns the file/console handlers (see setup_logging)
+_LOG_LISTENER = None
 
 def setup_logging():
-    """Setup comprehensive logging system for the application."""
+    """Setup comprehensive logging system for the application.
+
+    Records are only enqueued on the calling (GUI) thread; a QueueListener
+    thread does the actual file and console writes.
+
+    Idempotent: once set up, later calls just return the same logger without
+    opening another log file.
+    """
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        return logging.getLogger('EBANXTester')
+    from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     logs_dir = os.path.join(script_dir, 'logs')
@@ -77,13 +105,15 @@ def setup_logging():
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    # File handler with daily rotation
-    today = datetime.now().strftime('%Y%m%d')
-    log_file_path = os.path.join(logs_dir, f'ebanx_tester_{today}.log')
-    file_handler = RotatingFileHandler(
+    # File handler rotating at midnight, so a session that runs past it moves
+    # on to a new day's file. Finished days become ebanx_tester.log.YYYY-MM-DD
+    # and are all kept (backupCount=0).
+    log_file_path = os.path.join(logs_dir, 'ebanx_tester.log')
+    file_handler = TimedRotatingFileHandler(
         log_file_path,
-        maxBytes=10*1024*1024,  # 10MB
-        backupCount=5
+        when='midnight',
+        backupCount=0,
+        encoding='utf-8',
     )
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
@@ -93,103 +123,288 @@ def setup_logging():
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Route records through a queue to the listener thread
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    _LOG_LISTENER = QueueListener(log_queue, file_handler, console_handler)
+    _LOG_LISTENER.start()
     
     return logger
 
+
+@atexit.register
+def _stop_log_listener():
+    """Flush queued log records before the interpreter exits."""
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER = None
+
+# ---------------------------------------------------------------------------
+# JSON encode/decode helpers (orjson when available, stdlib json otherwise)
+# ---------------------------------------------------------------------------
+def _json_loads(data):
+    """Parse JSON from *data* (str or UTF-8 bytes)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj, indent: bool = False) -> str:
+    """Serialize *obj* to a JSON str, keeping non-ASCII characters as-is.
+
+    With *indent* the output matches ``json.dumps(obj, indent=2)``; otherwise
+    it is compact (no whitespace between tokens).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+def _json_dumpb(obj, indent: bool = False) -> bytes:
+    """Like _json_dumps but return UTF-8 bytes, ready to be sent as a body.
+
+    orjson already produces bytes, so this skips its decode/encode round-trip.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return _json_dumps(obj, indent).encode("utf-8")
+
+@contextmanager
+def _signals_blocked(*widgets):
+    """Block the signals of *widgets* for the duration of the ``with`` block.
+
+    Used when the window writes into its own inputs so that the change
+    handlers are never dispatched, instead of each one checking a flag.
+    """
+    blockers = [QSignalBlocker(w) for w in widgets]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
+
+# Customer profile fields copied into the default payment block, in output order
+_PAYMENT_CUSTOMER_KEYS = (
+    ("amount_total", "default_amount"),
+    ("currency_code", "currency_code"),
+    ("name", "name"),
+    ("email", "email"),
+    ("birth_date", "birth_date"),
+    ("country", "country"),
+    ("phone_number", "phone_number"),
+)
+# Card fields copied into the payment card block, in output order
+_PAYMENT_CARD_KEYS = ("card_number", "card_name", "card_due_date", "card_cvv")
+# Fixed trailing flags of the 3DS card block (merged after the card fields)
+_3DS_CARD_FLAGS = {
+    "auto_capture": False,  # 3DS specific: no auto capture
+    "threeds_force": True,  # 3DS specific: force 3DS
+}
+
+
+def _customer_payment_json(customer: Dict) -> str:
+    """Return the customer fields of the payment block as pre-indented JSON lines.
+
+    Customer data is static once loaded, so this is computed once per country
+    and spliced into every default payload.
+    """
+    return "".join(
+        f'    "{field}": {_json_dumps(customer[key])},\n'
+        for field, key in _PAYMENT_CUSTOMER_KEYS
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_payload_json(integration_key: str, customer_json: str, card: tuple,
+                        soft_descriptor: str) -> str:
+    """Return the default (non-custom) payment payload as indented JSON text.
+
+    All arguments are hashable snapshots of the UI state, so refreshes that
+    change nothing are a cache hit and skip both the build and the dump. The
+    structure is fixed, so the text is emitted straight from a template
+    (byte-identical to ``json.dumps(payload, indent=2, ensure_ascii=False)``
+    for the dict ``_build_payload_dict`` returns) with only the leaf
+    values run through the encoder for escaping. *customer_json* comes from
+    ``_customer_payment_json``.
+    """
+    enc = _json_dumps
+    card_number, card_name, card_due_date, card_cvv = card
+    soft = f',\n      "soft_descriptor": {enc(soft_descriptor)}' if soft_descriptor else ""
+    return (
+        "{\n"
+        f'  "integration_key": {enc(integration_key)},\n'
+        '  "operation": "request",\n'
+        '  "payment": {\n'
+        f"{customer_json}"
+        '    "card": {\n'
+        f'      "card_number": {enc(card_number)},\n'
+        f'      "card_name": {enc(card_name)},\n'
+        f'      "card_due_date": {enc(card_due_date)},\n'
+        f'      "card_cvv": {enc(card_cvv)},\n'
+        '      "auto_capture": true,\n'
+        f'      "threeds_force": false{soft}\n'
+        "    }\n"
+        "  }\n"
+        "}"
+    )
+
+
+def _build_payload_dict(integration_key: str, customer: Dict, card: Dict,
+                        soft_descriptor: str) -> Dict:
+    """Return the default (non-custom) payment payload as a dict.
+
+    Same structure and key order as the text ``_build_payload_json`` emits,
+    so callers that need both never have to parse that text back.
+    """
+    payment = {field: customer[key] for field, key in _PAYMENT_CUSTOMER_KEYS}
+    payment["card"] = card_block = {key: card[key] for key in _PAYMENT_CARD_KEYS}
+    card_block["auto_capture"] = True
+    card_block["threeds_force"] = False
+    if soft_descriptor:
+        card_block["soft_descriptor"] = soft_descriptor
+    return {"integration_key": integration_key, "operation": "request", "payment": payment}
+
+@lru_cache(maxsize=256)
+def _mask_middle(value: str, head: int, tail: int) -> str:
+    """Return *value* with all but the first *head* and last *tail* characters starred.
+
+    Values shorter than ``head + tail`` are returned unchanged. The card, CVV
+    and API key being masked rarely change between preview refreshes, so the
+    masked strings are memoized rather than rebuilt on every keystroke.
+    """
+    if len(value) < head + tail:
+        return value
+    return value[:head] + "*" * (len(value) - head - tail) + (value[-tail:] if tail else "")
+
+
 # ---------------------------------------------------------------------------
 # JSON Syntax Highlighter
 # ---------------------------------------------------------------------------
+# One compiled alternation so each block is scanned once. Named groups select
+# the format; "key" comes first so it wins over "string" for object keys.
+# QRegularExpression (PCRE2, JIT-compiled by optimize()) rather than ``re``:
+# its offsets are UTF-16 positions, which is what setFormat expects, so tokens
+# after an emoji in the same line are not shifted.
+_RE_JSON_TOKEN = QRegularExpression(
+    r'(?<key>\s*"[^"]+")\s*:'
+    r'|(?<string>"[^"\\]*(?:\\.[^"\\]*)*")'
+    r'|(?<number>\b\d+\.?\d*\b)'
+    r'|(?<boolean>\b(?:true|false)\b)'
+    r'|(?<null>\bnull\b)',
+    QRegularExpression.PatternOption.CaseInsensitiveOption,
+)
+_RE_JSON_TOKEN.optimize()
+# Capture group number -> format attribute. The alternatives are exclusive, so
+# a match's lastCapturedIndex() is the group that matched.
+_JSON_TOKEN_FORMATS = (None, "key_format", "string_format", "number_format",
+                       "boolean_format", "null_format")
+
 class JSONHighlighter(QSyntaxHighlighter):
-    """Syntax highlighter for JSON text."""
+    """Syntax highlighter for JSON text.
+
+    The character formats are built once and shared by every instance (each
+    JSON editor has its own highlighter); they are only ever read.
+    """
+
+    _formats = None
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_formats()
     
-    def setup_formats(self):
-        """Setup color formats for different JSON elements."""
+    @classmethod
+    def setup_formats(cls):
+        """Setup color formats for different JSON elements (first call only)."""
+        if cls._formats is not None:
+            return
+
         # String format (green)
-        self.string_format = QTextCharFormat()
-        self.string_format.setForeground(QColor("#228B22"))  # Forest green
-        self.string_format.setFontWeight(QFont.Weight.Bold)
+        cls.string_format = QTextCharFormat()
+        cls.string_format.setForeground(QColor("#228B22"))  # Forest green
+        cls.string_format.setFontWeight(QFont.Weight.Bold)
         
         # Number format (blue)
-        self.number_format = QTextCharFormat()
-        self.number_format.setForeground(QColor("#0000CD"))  # Medium blue
-        self.number_format.setFontWeight(QFont.Weight.Bold)
+        cls.number_format = QTextCharFormat()
+        cls.number_format.setForeground(QColor("#0000CD"))  # Medium blue
+        cls.number_format.setFontWeight(QFont.Weight.Bold)
         
         # Boolean format (purple)
-        self.boolean_format = QTextCharFormat()
-        self.boolean_format.setForeground(QColor("#8A2BE2"))  # Blue violet
-        self.boolean_format.setFontWeight(QFont.Weight.Bold)
+        cls.boolean_format = QTextCharFormat()
+        cls.boolean_format.setForeground(QColor("#8A2BE2"))  # Blue violet
+        cls.boolean_format.setFontWeight(QFont.Weight.Bold)
         
         # Null format (red)
-        self.null_format = QTextCharFormat()
-        self.null_format.setForeground(QColor("#DC143C"))  # Crimson
-        self.null_format.setFontWeight(QFont.Weight.Bold)
+        cls.null_format = QTextCharFormat()
+        cls.null_format.setForeground(QColor("#DC143C"))  # Crimson
+        cls.null_format.setFontWeight(QFont.Weight.Bold)
         
         # Key format (dark blue)
-        self.key_format = QTextCharFormat()
-        self.key_format.setForeground(QColor("#191970"))  # Midnight blue
-        self.key_format.setFontWeight(QFont.Weight.Bold)
+        cls.key_format = QTextCharFormat()
+        cls.key_format.setForeground(QColor("#191970"))  # Midnight blue
+        cls.key_format.setFontWeight(QFont.Weight.Bold)
+        
+        # Capture group number -> format, used by highlightBlock
+        cls._formats = [name and getattr(cls, name) for name in _JSON_TOKEN_FORMATS]
     
     def highlightBlock(self, text):
         """Highlight a block of text."""
-        import re
-        
-        # Highlight strings (quoted text)
-        string_pattern = r'"[^"\\]*(?:\\.[^"\\]*)*"'
-        for match in re.finditer(string_pattern, text):
-            start = match.start()
-            end = match.end()
-            self.setFormat(start, end - start, self.string_format)
-        
-        # Highlight numbers
-        number_pattern = r'\b\d+\.?\d*\b'
-        for match in re.finditer(number_pattern, text):
-            start = match.start()
-            end = match.end()
-            self.setFormat(start, end - start, self.number_format)
-        
-        # Highlight booleans
-        boolean_pattern = r'\b(true|false)\b'
-        for match in re.finditer(boolean_pattern, text, re.IGNORECASE):
-            start = match.start()
-            end = match.end()
-            self.setFormat(start, end - start, self.boolean_format)
-        
-        # Highlight null
-        null_pattern = r'\bnull\b'
-        for match in re.finditer(null_pattern, text, re.IGNORECASE):
-            start = match.start()
-            end = match.end()
-            self.setFormat(start, end - start, self.null_format)
-        
-        # Highlight keys (text before colon)
-        key_pattern = r'(\s*"[^"]+")\s*:'
-        for match in re.finditer(key_pattern, text):
-            start = match.start(1)
-            end = match.end(1)
-            self.setFormat(start, end - start, self.key_format)
+        formats = self._formats
+        matches = _RE_JSON_TOKEN.globalMatch(text)
+        while matches.hasNext():
+            match = matches.next()
+            group = match.lastCapturedIndex()
+            self.setFormat(match.capturedStart(group), match.capturedLength(group), formats[group])
 
 # ---------------------------------------------------------------------------
 # Enhanced JSON Text Editor
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _editor_font():
+    """Return the shared ``(monospace font, 4-space tab stop)`` for JSON editors.
+
+    Needs a running QApplication, so it is resolved on first use rather than at
+    import; every later editor reuses the measured values.
+    """
+    font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+    font.setPointSize(10)
+    return font, QFontMetricsF(font).horizontalAdvance(' ') * 4
+
+
 class JSONTextEdit(QPlainTextEdit):
-    """Enhanced text editor for JSON with syntax highlighting and formatting."""
+    """Enhanced text editor for JSON with syntax highlighting and formatting.
+
+    With *highlight_limit* set, highlighting is switched off while the
+    document is larger than that many characters: re-highlighting a large
+    read-only response is synchronous and would freeze the UI. *wrap_limit*
+    does the same for line wrapping, whose layout cost grows with the text
+    times the view width; the configured wrap mode returns for smaller text.
+    With *append_block_limit* set, appendPlainText drops the oldest lines
+    once the document grows past that many, so an appended log stays
+    bounded; text put in with setPlainText is never cut.
+    """
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, highlight_limit: Optional[int] = None,
+                 wrap_limit: Optional[int] = None,
+                 append_block_limit: Optional[int] = None):
         super().__init__(parent)
+        self.highlight_limit = highlight_limit
+        self.wrap_limit = wrap_limit
+        self.append_block_limit = append_block_limit
+        self._highlighting = True
+        # Wrap mode to restore once wrapping was suspended for a large text
+        self._suspended_wrap_mode = None
+        # Text last returned by json_data_if_changed; reset by programmatic edits
+        self._synced_text = None
         self.setup_editor()
     
     def setup_editor(self):
         """Setup the editor with monospace font and syntax highlighting."""
         # Set monospace font
-        font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
-        font.setPointSize(10)
+        font, tab_stop = _editor_font()
         self.setFont(font)
         
         # Set line wrap mode
@@ -199,39 +414,174 @@ class JSONTextEdit(QPlainTextEdit):
         self.highlighter = JSONHighlighter(self.document())
         
         # Set tab width
-        self.setTabStopDistance(self.fontMetrics().horizontalAdvance(' ') * 4)
+        self.setTabStopDistance(tab_stop)
     
+    def _set_highlighting(self, enabled: bool):
+        """Attach or detach the highlighter (attaching re-highlights the document)."""
+        if enabled != self._highlighting:
+            self._highlighting = enabled
+            self.highlighter.setDocument(self.document() if enabled else None)
+
+    def _set_wrapping(self, enabled: bool):
+        """Suspend (NoWrap) or restore the configured line wrap mode."""
+        if not enabled and self._suspended_wrap_mode is None:
+            self._suspended_wrap_mode = self.lineWrapMode()
+            self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        elif enabled and self._suspended_wrap_mode is not None:
+            self.setLineWrapMode(self._suspended_wrap_mode)
+            self._suspended_wrap_mode = None
+
+    def setPlainText(self, text):
+        self._synced_text = None
+        if self.highlight_limit is None and self.wrap_limit is None:
+            super().setPlainText(text)
+            return
+        size = len(text)
+        highlight = self.highlight_limit is None or size <= self.highlight_limit
+        wrap = self.wrap_limit is None or size <= self.wrap_limit
+        # Detach/unwrap before a large text goes in; re-enable only once a
+        # small one has replaced whatever large text was there. Repaints are
+        # held until the new text is fully laid out.
+        self.setUpdatesEnabled(False)
+        try:
+            if not highlight:
+                self._set_highlighting(False)
+            if not wrap:
+                self._set_wrapping(False)
+            super().setPlainText(text)
+            self._set_highlighting(highlight)
+            self._set_wrapping(wrap)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _trim_leading_blocks(self, keep_from: int):
+        """Drop the oldest blocks past append_block_limit, but none at or after *keep_from*."""
+        excess = min(self.blockCount() - self.append_block_limit, keep_from)
+        if excess <= 0:
+            return
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.NextBlock,
+                            QTextCursor.MoveMode.KeepAnchor, excess)
+        cursor.removeSelectedText()
+
+    def appendPlainText(self, text):
+        # Index of the first appended block (an empty document's only block
+        # is reused for the text)
+        first_new = 0 if self.document().isEmpty() else self.blockCount()
+        if self.highlight_limit is None and self.wrap_limit is None:
+            super().appendPlainText(text)
+            if self.append_block_limit is not None:
+                self._trim_leading_blocks(first_new)
+            return
+        # Decide from the size after the append (+1 for the new paragraph
+        # separator) so a large body is never highlighted or wrapped before
+        # those are switched off
+        size = self.document().characterCount() + len(text) + 1
+        highlight = self.highlight_limit is None or size <= self.highlight_limit
+        wrap = self.wrap_limit is None or size <= self.wrap_limit
+        self.setUpdatesEnabled(False)
+        try:
+            if not highlight:
+                self._set_highlighting(False)
+            if not wrap:
+                self._set_wrapping(False)
+            super().appendPlainText(text)
+            if self.append_block_limit is not None:
+                # Only older content is dropped – the block just appended stays whole
+                self._trim_leading_blocks(first_new)
+            self._set_highlighting(highlight)
+            self._set_wrapping(wrap)
+        finally:
+            self.setUpdatesEnabled(True)
+
     def set_json_text(self, data):
         """Set JSON data with proper formatting."""
         if isinstance(data, str):
             try:
                 # Try to parse and re-format if it's JSON string
-                parsed = json.loads(data)
-                formatted = json.dumps(parsed, indent=2, ensure_ascii=False)
+                parsed = _json_loads(data)
+                formatted = _json_dumps(parsed, indent=True)
             except (json.JSONDecodeError, TypeError):
                 # If not valid JSON, just use as-is
                 formatted = data
         else:
             # If it's already a dict/list, format it
-            formatted = json.dumps(data, indent=2, ensure_ascii=False)
+            formatted = _json_dumps(data, indent=True)
         
+        # Re-setting identical text would re-highlight every block and reset the cursor
+        if formatted == self.toPlainText():
+            return
         self.setPlainText(formatted)
     
+    def replace_json_values(self, changes) -> bool:
+        """Patch ``"key": old`` to ``"key": new`` in place for each (key, old, new).
+
+        Only the touched lines are re-highlighted and the scroll/cursor position
+        is kept. Returns False (text untouched) if any pair cannot be located
+        exactly once.
+        """
+        doc = self.document()
+        flags = QTextDocument.FindFlag.FindCaseSensitively
+        found = []
+        for key, old, new in changes:
+            needle = f"{_json_dumps(key)}: {_json_dumps(old)}"
+            match = doc.find(needle, 0, flags)
+            if match.isNull() or not doc.find(needle, match, flags).isNull():
+                return False
+            found.append((match, f"{_json_dumps(key)}: {_json_dumps(new)}"))
+
+        # Found cursors track earlier edits, so positions stay valid as we go
+        edit = QTextCursor(doc)
+        edit.beginEditBlock()
+        for match, replacement in found:
+            edit.setPosition(match.selectionStart())
+            edit.setPosition(match.selectionEnd(), QTextCursor.MoveMode.KeepAnchor)
+            edit.insertText(replacement)
+        edit.endEditBlock()
+        self._synced_text = None
+        return True
+    
     def get_json_data(self):
         """Get the current text as JSON data."""
         text = self.toPlainText().strip()
         if not text:
             return None
         try:
-            return json.loads(text)
+            return _json_loads(text)
         except json.JSONDecodeError:
             return None
+
+    def json_data_if_changed(self):
+        """Like get_json_data, but None if the text is the one last returned here.
+
+        Lets the payload -> form sync skip the parse when the user edits back
+        to (or the editor re-emits) text that was already synced. Programmatic
+        text changes reset this, so the next sync always parses.
+        """
+        text = self.toPlainText()
+        if text == self._synced_text:
+            return None
+        data = self.get_json_data()
+        if data:
+            self._synced_text = text
+        return data
     
     def format_json(self):
-        """Format the current JSON text."""
+        """Format the current JSON text.
+
+        Already-formatted text is left untouched (set_json_text compares
+        first); otherwise the cursor and scroll position are kept as far as
+        the reformatted text allows.
+        """
         data = self.get_json_data()
         if data is not None:
+            position = self.textCursor().position()
+            scroll = self.verticalScrollBar().value()
             self.set_json_text(data)
+            cursor = self.textCursor()
+            cursor.setPosition(min(position, self.document().characterCount() - 1))
+            self.setTextCursor(cursor)
+            self.verticalScrollBar().setValue(scroll)
             return True
         return False
 
@@ -240,30 +590,170 @@ class JSONTextEdit(QPlainTextEdit):
 # ---------------------------------------------------------------------------
 
 
-class APICallWorker(QObject):
-    """Runs the blocking requests.post call in a separate thread."""
+# Shared HTTP session so repeat test runs reuse the kept-alive TLS connection
+# to the API instead of paying a fresh handshake each time. It is created on
+# the first API call so ``requests`` stays out of GUI start-up.
+_HTTP: Optional["requests.Session"] = None
+_HTTP_LOCK = threading.Lock()
 
-    finished = Signal(object)  # emits requests.Response on success
-    error = Signal(str)        # emits error string
 
-    def __init__(self, url: str, payload_data: dict, headers: dict):
+def _get_http_session() -> "requests.Session":
+    """Return the shared HTTP session, importing ``requests`` on first use."""
+    global _HTTP
+    with _HTTP_LOCK:
+        if _HTTP is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            # Sent on every call; per-request headers only add what varies
+            session.headers["User-Agent"] = "EBANX-PTP-Tester/Qt"
+            # One pooled adapter for both schemes (a custom base URL may be http)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _HTTP = session
+        return _HTTP
+
+
+def _close_http_session():
+    """Close the shared HTTP session (if one was created), releasing its sockets."""
+    global _HTTP
+    with _HTTP_LOCK:
+        if _HTTP is not None:
+            _HTTP.close()
+            _HTTP = None
+
+
+class ResponseBody(NamedTuple):
+    """An API response body, decoded and formatted on the worker thread."""
+
+    is_json: bool
+    data: object  # parsed JSON document (only meaningful when is_json)
+    text: str     # pretty-printed JSON, or the raw body text
+
+
+def _decode_response_body(resp, pretty: bool = True, need_data: bool = False) -> ResponseBody:
+    """Parse *resp*'s body and pre-format it for display.
+
+    With *pretty* off a JSON body is shown exactly as received and is only
+    parsed when the caller needs the data (*need_data*).
+    """
+    if not pretty:
+        if not need_data:
+            is_json = "application/json" in resp.headers.get("Content-Type", "")
+            return ResponseBody(is_json, None, resp.text)
+        try:
+            data = _json_loads(resp.content)
+        except ValueError:
+            return ResponseBody(False, None, resp.text)
+        return ResponseBody(True, data, resp.text)
+    try:
+        data = _json_loads(resp.content)
+    except ValueError:
+        return ResponseBody(False, None, resp.text)
+    return ResponseBody(True, data, _json_dumps(data, indent=True))
+
+
+class APICallSignals(QObject):
+    """Signals emitted by APICallWorker (a QRunnable cannot own signals itself)."""
+
+    finished = Signal(object, object)  # emits (requests.Response, ResponseBody) on success
+    error = Signal(str)                # emits error string
+
+
+class APICallWorker(QRunnable):
+    """Runs the blocking session.post call on a QThreadPool thread."""
+
+    def __init__(self, url: str, body: bytes, headers: dict,
+                 session: Optional["requests.Session"] = None,
+                 pretty: bool = True, need_data: bool = False):
+        """*body* is the already-serialized JSON request body (UTF-8).
+
+        *pretty* and *need_data* are passed on to _decode_response_body.
+        """
         super().__init__()
+        # The caller keeps a Python reference; don't let the pool delete us
+        self.setAutoDelete(False)
+        self.signals = APICallSignals()
         self.url = url
-        self.payload_data = payload_data
+        self.body = body
         self.headers = headers
+        self.session = session
+        self.pretty = pretty
+        self.need_data = need_data
 
     def run(self):
-        """Execute the HTTP request (runs inside a QThread)."""
+        """Execute the HTTP request (runs on a pooled thread)."""
+        import requests
+
+        session = self.session or _get_http_session()
         try:
-            resp = requests.post(
+            resp = session.post(
                 self.url,
-                json=self.payload_data,
+                data=self.body,
                 headers=self.headers,
                 timeout=30,
             )
-            self.finished.emit(resp)
         except requests.exceptions.RequestException as exc:
-            self.error.emit(str(exc))
+            self.signals.error.emit(str(exc))
+            return
+        # Parse and pretty-print here so large bodies don't stall the GUI thread
+        self.signals.finished.emit(resp, _decode_response_body(resp, self.pretty, self.need_data))
+
+
+class FileWriteSignals(QObject):
+    """Signals emitted by FileWriteJob."""
+
+    finished = Signal(object)  # emits the job itself once it is done
+    error = Signal(str)        # emits error string
+
+
+class FileWriteJob(QRunnable):
+    """Atomically replace *path* with *data* on a pool thread.
+
+    The bytes go to a sibling temp file which is fsynced and then renamed
+    over *path*, so a crash mid-write never leaves a truncated file behind.
+    """
+
+    def __init__(self, path: str, data: bytes):
+        super().__init__()
+        # The caller keeps a Python reference; don't let the pool delete us
+        self.setAutoDelete(False)
+        self.signals = FileWriteSignals()
+        self.path = path
+        self.data = data
+
+    def run(self):
+        """Write the file (runs on a pooled thread)."""
+        tmp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "wb") as fh:
+                fh.write(self.data)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            self.signals.error.emit(str(exc))
+        finally:
+            self.signals.finished.emit(self)
+
+# Response status class (status_code // 100, 5xx and above as 5) ->
+# (status line, log level, log message)
+_STATUS_CLASSES = {
+    2: ("✅ Success\n", logging.INFO, "%(label)s call successful"),
+    4: ("❌ Client Error\n", logging.WARNING, "%(label)s client error: %(code)s"),
+    5: ("🔥 Server Error\n", logging.ERROR, "%(label)s server error: %(code)s"),
+}
+_STATUS_OTHER = ("⚠️  Other Status\n", logging.WARNING, "%(label)s unexpected status: %(code)s")
+
+_REQUEST_INFO_RULE = "─" * 50 + "\n"
+
+def _format_request_info(ctx) -> str:
+    """Format the request header from a ``(url, ptp, details, started)`` context."""
+    url, ptp, details, started = ctx
+    return f"🌐 POST {url}\n📋 PTP: {ptp}\n{details}⏰ {started:%H:%M:%S}\n{_REQUEST_INFO_RULE}"
 
 # ---------------------------------------------------------------------------
 # Helpers for loading data
@@ -275,6 +765,19 @@ CARDS_FILE = os.path.join(DATA_DIR, "test-cards.json")
 APMS_FILE = os.path.join(DATA_DIR, "test-apms.json")
 PTP_FILE = os.path.join(DATA_DIR, "ptp-list.txt")
 
+# Response panes are not syntax-highlighted while they hold more characters
+# than this; see JSONTextEdit
+RESPONSE_HIGHLIGHT_LIMIT = 50000
+
+# Response panes switch off line wrapping while they hold more characters than
+# this; see JSONTextEdit
+RESPONSE_WRAP_LIMIT = 200000
+
+# Appending to a response pane drops its oldest lines past this many, so a long
+# session of appended non-JSON/error output cannot make every append slower.
+# Responses shown with setPlainText are never cut (see JSONTextEdit).
+RESPONSE_MAX_BLOCKS = 20000
+
 def create_dummy_apm_data():
     """Create dummy APM test data for first-time users."""
     return {
@@ -479,26 +982,31 @@ def load_json(path: str):
         # If this is the test-cards.json file, create it with dummy data
         if path.endswith("test-cards.json"):
             dummy_data = create_dummy_test_data()
-            with open(path, "w", encoding="utf-8") as fh:
-                json.dump(dummy_data, fh, indent=2)
+            # Compact, like every later save (see TesterWindow._write_cards_file)
+            with open(path, "wb") as fh:
+                fh.write(_json_dumpb(dummy_data))
             return dummy_data
         # If this is the test-apms.json file, create it with dummy APM data
         elif path.endswith("test-apms.json"):
             dummy_data = create_dummy_apm_data()
-            with open(path, "w", encoding="utf-8") as fh:
-                json.dump(dummy_data, fh, indent=2)
+            with open(path, "wb") as fh:
+                fh.write(_json_dumpb(dummy_data, indent=True))
             return dummy_data
         else:
             raise FileNotFoundError(path)
     
-    with open(path, "r", encoding="utf-8") as fh:
-        return json.load(fh)
+    with open(path, "rb") as fh:
+        return _json_loads(fh.read())
 
 def load_lines(path: str) -> List[str]:
-    if not os.path.exists(path):
-        raise FileNotFoundError(path)
-    with open(path, "r", encoding="utf-8") as fh:
-        return [line.strip() for line in fh if line.strip()]
+    # open() raises FileNotFoundError itself, so no separate exists() check.
+    # Binary read + one decode skips the text layer's newline translation;
+    # splitlines handles \r\n anyway.
+    with open(path, "rb") as fh:
+        raw = fh.read().decode("utf-8")
+    # One read + splitlines, stripping each line once (PTP codes never carry
+    # meaningful surrounding whitespace)
+    return [line for line in map(str.strip, raw.splitlines()) if line]
 
 # ---------------------------------------------------------------------------
 # Main Window
@@ -509,27 +1017,105 @@ class TesterWindow(QMainWindow):
         self.setWindowTitle("EBANX PTP Tester by Wiza Jalakasi- wiza@ebanx.com")
         self.resize(1400, 900)  # Increased size for better layout
 
-        # Setup logging for this instance
+        # Shared application logger; set up once per process (see setup_logging)
         self.logger = setup_logging()
         self.logger.info("Initializing TesterWindow")
 
         try:
             self.test_data: Dict = load_json(CARDS_FILE)
-            self.logger.info(f"Loaded test data: {len(self.test_data)} countries")
+            self.logger.info("Loaded test data: %s countries", len(self.test_data))
             self.apm_data: Dict = load_json(APMS_FILE)
-            self.logger.info(f"Loaded APM data: {len(self.apm_data)} countries")
+            self.logger.info("Loaded APM data: %s countries", len(self.apm_data))
             self.ptp_list: List[str] = load_lines(PTP_FILE)
-            self.logger.info(f"Loaded PTP list: {len(self.ptp_list)} profiles")
+            self.logger.info("Loaded PTP list: %s profiles", len(self.ptp_list))
         except Exception as exc:
-            self.logger.error(f"Failed to load data: {exc}")
+            self.logger.error("Failed to load data: %s", exc)
             QMessageBox.critical(self, "Data error", str(exc))
             raise SystemExit(1)
 
-        # Flag to avoid feedback loops when syncing between editors
-        self._syncing: bool = False
+        # Last payload dict/text emitted into the Non-3DS payload editor, used to
+        # patch only the changed card values instead of re-setting the document
+        self._last_payload: Optional[Dict] = None
+        self._last_payload_text: str = ""
+
+        # id(saved payload) -> (saved payload, serialized JSON); see _clone_custom_payload
+        self._custom_payload_json: Dict[int, tuple] = {}
+
+        # id(card) -> (country, card_type, index); maintained by flatten_cards
+        self._card_index: Dict[int, tuple] = {}
+
+        # country -> pre-serialized customer fields of the default payload
+        self._customer_json: Dict[str, str] = {}
+        self._index_customer_json()
+
+        # (country, card_type, card) per card in display order; see _rebuild_card_records
+        self._card_records: List[tuple] = []
+        self._rebuild_card_records()
+
+        # Debounce timers: coalesce bursts of keystrokes so the payload is
+        # only re-parsed / rebuilt once the user pauses typing
+        self._payload_parse_timer = QTimer(self)
+        self._payload_parse_timer.setSingleShot(True)
+        self._payload_parse_timer.setInterval(150)
+        self._payload_parse_timer.timeout.connect(self._do_payload_sync)
+
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(150)
+        self._preview_timer.timeout.connect(self.update_payload_preview)
+
+        # Same pair for the 3DS and APM tabs
+        self._payload_parse_timer_3ds = QTimer(self)
+        self._payload_parse_timer_3ds.setSingleShot(True)
+        self._payload_parse_timer_3ds.setInterval(150)
+        self._payload_parse_timer_3ds.timeout.connect(self._do_payload_sync_3ds)
+
+        self._preview_timer_3ds = QTimer(self)
+        self._preview_timer_3ds.setSingleShot(True)
+        self._preview_timer_3ds.setInterval(150)
+        self._preview_timer_3ds.timeout.connect(self.update_payload_preview_3ds)
+
+        self._payload_parse_timer_apm = QTimer(self)
+        self._payload_parse_timer_apm.setSingleShot(True)
+        self._payload_parse_timer_apm.setInterval(150)
+        self._payload_parse_timer_apm.timeout.connect(self._do_payload_sync_apm)
+
+        self._preview_timer_apm = QTimer(self)
+        self._preview_timer_apm.setSingleShot(True)
+        self._preview_timer_apm.setInterval(150)
+        self._preview_timer_apm.timeout.connect(self.update_payload_preview_apm)
+
+        # Settings changes (selections, toggles, edits) are written once they
+        # settle instead of on every signal; see _persist_settings
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(500)
+        self._settings_timer.timeout.connect(self._save_settings)
+
+        # Background file writes (see _write_cards_file). One thread keeps
+        # successive saves in order; jobs are referenced until they finish.
+        self._file_pool = QThreadPool(self)
+        self._file_pool.setMaxThreadCount(1)
+        self._pending_writes = set()
+
+        # PTP filter boxes re-filter their combo once typing pauses
+        self._ptp_filter_timers: Dict[str, QTimer] = {}
+        for suffix, apply_filter in (
+            ("", self._apply_ptp_filter),
+            ("_3ds", self._apply_ptp_filter_3ds),
+            ("_apm", self._apply_ptp_filter_apm),
+        ):
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(80)
+            timer.timeout.connect(apply_filter)
+            self._ptp_filter_timers[suffix] = timer
 
         # Load persisted settings
         self.cfg = load_config()
+        # Unmasked API key while privacy mode shows a masked one; set for
+        # real once the key field exists (see the end of __init__)
+        self._original_api_key = ""
 
         # ------------------------------------------------------------------
         # Top-level widgets
@@ -582,6 +1168,13 @@ class TesterWindow(QMainWindow):
         # Connect privacy mode changes to update displays
         self.privacy_mode_checkbox.toggled.connect(self.on_privacy_mode_changed)
 
+        # Pretty-print JSON responses (off = show the body exactly as received)
+        self.pretty_response_checkbox = QCheckBox("Pretty JSON")
+        self.pretty_response_checkbox.setChecked(self.cfg.get("pretty_responses", True))
+        self.pretty_response_checkbox.setToolTip("Re-indent JSON responses; uncheck to show the raw body")
+        self.pretty_response_checkbox.toggled.connect(self._persist_settings)
+        config_row.addWidget(self.pretty_response_checkbox)
+
         # Removed Test Connection button
         config_row.addStretch(1)
 
@@ -589,12 +1182,27 @@ class TesterWindow(QMainWindow):
         # Tab-based interface
         # ------------------------------------------------------------------
         self.tab_widget = QTabWidget()
+        # Tab min-width last applied by setup_uniform_tabs
+        self._tab_style_width: Optional[int] = None
         outer_vbox.addWidget(self.tab_widget, stretch=1)
 
-        # Create the three tabs
+        # Create the three tabs. Only Non-3DS is built up front; the 3DS and
+        # APM tabs start as placeholders and are built on first activation
+        # (see _ensure_tab_built), keeping their widgets out of startup.
         self.create_non3ds_tab()
-        self.create_3ds_tab()
-        self.create_apms_tab()
+        # 3DS/APM widgets the shared handlers and _save_settings touch; None
+        # until that tab is built
+        self.card_combo_3ds = None
+        self.card_fields_3ds = None
+        self.payload_edit_3ds = None
+        self.ptp_combo_3ds = None
+        self.ptp_combo_apm = None
+        self._lazy_tabs = {}
+        for builder, title in ((self.create_3ds_tab, "3DS (Authenticated)"),
+                               (self.create_apms_tab, "APMs")):
+            index = self.tab_widget.addTab(QWidget(), title)
+            self._lazy_tabs[index] = builder
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
 
         # Set uniform tab widths
         self.setup_uniform_tabs()
@@ -633,7 +1241,10 @@ class TesterWindow(QMainWindow):
         content_splitter.addWidget(left_widget)
 
         left_box.addWidget(QLabel("Select Card:"))
+        # Backed by a string-list model so repopulating is one model reset
+        self._card_model = QStringListModel(self)
         self.card_combo = QComboBox()
+        self.card_combo.setModel(self._card_model)
         # card_fields will be created below; populate after that
         self.card_combo.currentIndexChanged.connect(self.on_card_changed)
         # Connect card selection change to save settings
@@ -672,6 +1283,11 @@ class TesterWindow(QMainWindow):
         self.delete_btn = QPushButton("Delete")
         self.delete_btn.clicked.connect(self.delete_current_card)
         btn_row.addWidget(self.delete_btn)
+
+        self.export_cards_btn = QPushButton("Export Pretty")
+        self.export_cards_btn.setToolTip("Save an indented copy of the cards file")
+        self.export_cards_btn.clicked.connect(self.export_cards_pretty)
+        btn_row.addWidget(self.export_cards_btn)
         left_box.addLayout(btn_row)
 
         # ------------------------------------------------------------------------
@@ -715,8 +1331,14 @@ class TesterWindow(QMainWindow):
         self.ptp_filter_edit.textChanged.connect(self.update_ptp_filter)
         right_box.addWidget(self.ptp_filter_edit)
 
+        # The combo shows a case-insensitive filter proxy over the full PTP
+        # list, so filtering never rebuilds the combo's items
+        self._ptp_model = QStringListModel(self.ptp_list, self)
+        self._ptp_proxy = QSortFilterProxyModel(self)
+        self._ptp_proxy.setSourceModel(self._ptp_model)
+        self._ptp_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.ptp_combo = QComboBox()
-        self.ptp_combo.addItems(self.ptp_list)
+        self.ptp_combo.setModel(self._ptp_proxy)
         # Set the last selected PTP if available
         last_ptp = self.cfg.get("last_ptp", "")
         if last_ptp and last_ptp in self.ptp_list:
@@ -740,7 +1362,9 @@ class TesterWindow(QMainWindow):
         right_box.addLayout(response_header)
         
         # Use enhanced JSON editor for response
-        self.response_edit = JSONTextEdit()
+        self.response_edit = JSONTextEdit(highlight_limit=RESPONSE_HIGHLIGHT_LIMIT,
+                                          wrap_limit=RESPONSE_WRAP_LIMIT,
+                                          append_block_limit=RESPONSE_MAX_BLOCKS)
         self.response_edit.setReadOnly(True)
         # Enable text wrapping for better readability of long responses
         self.response_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
@@ -752,8 +1376,26 @@ class TesterWindow(QMainWindow):
         # Add tab to widget
         self.tab_widget.addTab(tab, "Non-3DS (Unauthenticated)")
 
+    def _ensure_tab_built(self, index: int):
+        """Build a placeholder tab's real contents the first time it is shown."""
+        builder = self._lazy_tabs.pop(index, None)
+        if builder is None:
+            return
+        placeholder = self.tab_widget.widget(index)
+        title = self.tab_widget.tabText(index)
+        tab = builder()
+        # Swap silently: removing the current tab would re-enter this slot
+        with _signals_blocked(self.tab_widget):
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, title)
+            self.tab_widget.setCurrentIndex(index)
+        placeholder.deleteLater()
+
     def create_3ds_tab(self):
-        """Create the 3DS (Authenticated) tab with same UI as Non-3DS but different API parameters."""
+        """Create the 3DS (Authenticated) tab with same UI as Non-3DS but different API parameters.
+
+        Returns the tab widget; it is built on first activation (see _ensure_tab_built).
+        """
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
@@ -767,7 +1409,10 @@ class TesterWindow(QMainWindow):
         content_splitter.addWidget(left_widget)
 
         left_box.addWidget(QLabel("Select Card:"))
+        # Backed by a string-list model so repopulating is one model reset
+        self._card_model_3ds = QStringListModel(self)
         self.card_combo_3ds = QComboBox()
+        self.card_combo_3ds.setModel(self._card_model_3ds)
         # card_fields_3ds will be created below; populate after that
         self.card_combo_3ds.currentIndexChanged.connect(self.on_card_changed_3ds)
         # Connect card selection change to save settings
@@ -854,8 +1499,13 @@ class TesterWindow(QMainWindow):
         self.ptp_filter_edit_3ds.textChanged.connect(self.update_ptp_filter_3ds)
         right_box.addWidget(self.ptp_filter_edit_3ds)
 
+        # Same filter proxy setup as the Non-3DS PTP combo
+        self._ptp_model_3ds = QStringListModel(self.ptp_list, self)
+        self._ptp_proxy_3ds = QSortFilterProxyModel(self)
+        self._ptp_proxy_3ds.setSourceModel(self._ptp_model_3ds)
+        self._ptp_proxy_3ds.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.ptp_combo_3ds = QComboBox()
-        self.ptp_combo_3ds.addItems(self.ptp_list)
+        self.ptp_combo_3ds.setModel(self._ptp_proxy_3ds)
         # Set the last selected PTP for 3DS tab if available
         last_ptp_3ds = self.cfg.get("last_ptp_3ds", "")
         if last_ptp_3ds and last_ptp_3ds in self.ptp_list:
@@ -879,6 +1529,7 @@ class TesterWindow(QMainWindow):
         # 3DS Authentication button
         self.authenticate_3ds_btn_3ds = QPushButton("Authenticate 3DS in Browser")
         self.authenticate_3ds_btn_3ds.setEnabled(False)  # Initially disabled
+        self._current_3ds_url_3ds = None  # Set by _check_for_3ds_url_3ds
         self.authenticate_3ds_btn_3ds.clicked.connect(self.authenticate_3ds_in_browser_3ds)
         response_header.addWidget(self.authenticate_3ds_btn_3ds)
         
@@ -886,7 +1537,9 @@ class TesterWindow(QMainWindow):
         right_box.addLayout(response_header)
         
         # Use enhanced JSON editor for response
-        self.response_edit_3ds = JSONTextEdit()
+        self.response_edit_3ds = JSONTextEdit(highlight_limit=RESPONSE_HIGHLIGHT_LIMIT,
+                                              wrap_limit=RESPONSE_WRAP_LIMIT,
+                                              append_block_limit=RESPONSE_MAX_BLOCKS)
         self.response_edit_3ds.setReadOnly(True)
         # Enable text wrapping for better readability of long responses
         self.response_edit_3ds.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
@@ -895,11 +1548,13 @@ class TesterWindow(QMainWindow):
         # Set splitter proportions (60% left, 40% right)
         content_splitter.setSizes([840, 560])
 
-        # Add tab to widget
-        self.tab_widget.addTab(tab, "3DS (Authenticated)")
+        return tab
 
     def create_apms_tab(self):
-        """Create the APMs (Alternative Payment Methods) tab."""
+        """Create the APMs (Alternative Payment Methods) tab.
+
+        Returns the tab widget; it is built on first activation (see _ensure_tab_built).
+        """
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
@@ -909,7 +1564,9 @@ class TesterWindow(QMainWindow):
         
         # APM selector
         top_row.addWidget(QLabel("APM Profile:"))
+        self._apm_model = QStringListModel(self)
         self.apm_combo = QComboBox()
+        self.apm_combo.setModel(self._apm_model)
         self.apm_combo.setMinimumWidth(300)
         top_row.addWidget(self.apm_combo)
         top_row.addStretch(1)  # Push APM selector to the left
@@ -1004,7 +1661,13 @@ class TesterWindow(QMainWindow):
         right_layout.addWidget(self.ptp_filter_apm)
         
         # PTP selector
+        # Same filter proxy setup as the Non-3DS PTP combo
+        self._ptp_model_apm = QStringListModel(self)
+        self._ptp_proxy_apm = QSortFilterProxyModel(self)
+        self._ptp_proxy_apm.setSourceModel(self._ptp_model_apm)
+        self._ptp_proxy_apm.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.ptp_combo_apm = QComboBox()
+        self.ptp_combo_apm.setModel(self._ptp_proxy_apm)
         right_layout.addWidget(self.ptp_combo_apm)
         
         # Payload section
@@ -1030,7 +1693,9 @@ class TesterWindow(QMainWindow):
         
         # Response section
         right_layout.addWidget(QLabel("Response:"))
-        self.response_edit_apm = JSONTextEdit()
+        self.response_edit_apm = JSONTextEdit(highlight_limit=RESPONSE_HIGHLIGHT_LIMIT,
+                                              wrap_limit=RESPONSE_WRAP_LIMIT,
+                                              append_block_limit=RESPONSE_MAX_BLOCKS)
         self.response_edit_apm.setReadOnly(True)
         self.response_edit_apm.setMinimumHeight(200)
         # Enable text wrapping for better readability of long responses
@@ -1057,27 +1722,26 @@ class TesterWindow(QMainWindow):
         # Connect APM combo change
         self.apm_combo.currentIndexChanged.connect(self.on_apm_changed)
         
-        # Add tab to widget
-        self.tab_widget.addTab(tab, "APMs")
+        return tab
 
     def setup_uniform_tabs(self):
         """Set all tabs to have uniform width based on the longest tab."""
         # Get the tab bar
         tab_bar = self.tab_widget.tabBar()
         
-        # Calculate the width needed for the longest tab text
-        font_metrics = tab_bar.fontMetrics()
-        max_width = 0
-        
-        # Check all tab texts to find the longest one
-        for i in range(self.tab_widget.count()):
-            tab_text = self.tab_widget.tabText(i)
-            text_width = font_metrics.horizontalAdvance(tab_text)
-            max_width = max(max_width, text_width)
+        # Measure only the longest tab text – one shaping pass instead of one per tab
+        texts = [self.tab_widget.tabText(i) for i in range(self.tab_widget.count())]
+        longest = max(texts, key=len, default="")
+        max_width = tab_bar.fontMetrics().horizontalAdvance(longest)
         
         # Add padding for tab styling (borders, margins, etc.)
         tab_width = max_width + 40  # Add 40px padding
         
+        # Restyling is expensive – skip it when the width has not changed
+        if self._tab_style_width == tab_width:
+            return
+        self._tab_style_width = tab_width
+        
         # Set the minimum width for each tab
         tab_bar.setStyleSheet(f"""
             QTabBar::tab {{
@@ -1089,29 +1753,96 @@ class TesterWindow(QMainWindow):
     # ------------------------------------------------------------------
     # Data helpers
     # ------------------------------------------------------------------
+    def _rebuild_card_records(self):
+        """Flatten *self.test_data* into ``self._card_records``.
+
+        One ``(country, card_type, card)`` record per card, in display order.
+        Called whenever test_data is (re)loaded; add/delete keep it in step
+        via _add_card / _remove_card so the combos never re-walk the dict.
+        """
+        self._card_records = [
+            (country, card_type, card)
+            for country, data in self.test_data.items()
+            for card_type, card_list in data.get("debitcard", {}).items()
+            for card in card_list
+        ]
+
+    def _add_card(self, country: str, card_type: str, card: Dict):
+        """Append *card* to test_data and insert its record in display order."""
+        debitcards = self.test_data[country]["debitcard"]
+        new_type = card_type not in debitcards
+        debitcards.setdefault(card_type, []).append(card)
+        # A new card goes after the last card of its type; a new type starts
+        # after the country's last card (dict order puts the new key last).
+        records = self._card_records
+        pos = None
+        for i in range(len(records) - 1, -1, -1):
+            rec_country, rec_type, _ = records[i]
+            if rec_country == country and (new_type or rec_type == card_type):
+                pos = i + 1
+                break
+        if pos is None:
+            # Country has no cards left: insert before the next country's cards
+            countries = list(self.test_data)
+            later = set(countries[countries.index(country) + 1:])
+            pos = next((i for i, rec in enumerate(records) if rec[0] in later), len(records))
+        records.insert(pos, (country, card_type, card))
+
+    def _remove_card(self, country: str, card_type: str, card_idx: int):
+        """Delete a card from test_data and drop its record."""
+        card_list = self.test_data[country]["debitcard"][card_type]
+        card = card_list.pop(card_idx)
+        # Clean up if list empty
+        if not card_list:
+            del self.test_data[country]["debitcard"][card_type]
+        self._card_records = [rec for rec in self._card_records if rec[2] is not card]
+
     def flatten_cards(self):
-        cards = []
-        for country, data in self.test_data.items():
-            for card_list in data.get("debitcard", {}).values():
-                for card in card_list:
-                    display = f"{country} – {card['description']}"
-                    cards.append((display, country, card))
-        return cards
+        """Return parallel ``(displays, countries, cards, customers)`` lists for the combos.
+
+        Index *i* of each list describes the same card, so the combo's display
+        list can be handed to the combo's model as-is and lookups are plain indexing.
+        """
+        displays: List[str] = []
+        countries: List[str] = []
+        cards: List[Dict] = []
+        customers: List[Dict] = []
+        test_data = self.test_data
+        card_index = {}
+        prev_group = None
+        idx = 0
+        for country, card_type, card in self._card_records:
+            # Records are grouped by (country, card_type); idx is the position
+            # within the group, i.e. in test_data[country]["debitcard"][card_type]
+            group = (country, card_type)
+            idx = idx + 1 if group == prev_group else 0
+            prev_group = group
+            displays.append(f"{country} – {card['description']}")
+            countries.append(country)
+            cards.append(card)
+            customers.append(test_data[country]["customer_data"])
+            card_index[id(card)] = (country, card_type, idx)
+        # Rebuilt on every pass so _find_card_path can skip the full scan
+        self._card_index = card_index
+        return displays, countries, cards, customers
 
     # ------------------------------------------------------------------
     # UI population / events
     # ------------------------------------------------------------------
     def populate_card_combo(self):
-        self.flat_cards = self.flatten_cards()
-        self.card_combo.clear()
-        self.card_combo.addItems([t[0] for t in self.flat_cards])
-        if self.flat_cards:
-            self.card_combo.setCurrentIndex(0)
-            self.apply_card_to_form(self.flat_cards[0][2])
+        (self.flat_displays, self.flat_countries,
+         self.flat_cards, self.flat_customers) = self.flatten_cards()
+        # Swap the whole list silently, then load the first card once (clear +
+        # addItems fired currentIndexChanged twice and applied the card twice)
+        with _signals_blocked(self.card_combo):
+            self._card_model.setStringList(self.flat_displays)
+            if self.flat_cards:
+                self.card_combo.setCurrentIndex(0)
+        self.on_card_changed(0)
 
     def on_card_changed(self, idx: int):
         if 0 <= idx < len(self.flat_cards):
-            _, _, card = self.flat_cards[idx]
+            card = self.flat_cards[idx]
             self.apply_card_to_form(card)
             self.update_payload_preview()
 
@@ -1123,18 +1854,18 @@ class TesterWindow(QMainWindow):
             card_number = self.mask_card_number(card_number)
             cvv = self.mask_cvv(cvv)
         
-        self.card_fields[0].setText(card_number)
-        self.card_fields[1].setText(card["card_name"])
-        self.card_fields[2].setText(card["card_due_date"])
-        self.card_fields[3].setText(cvv)
+        # Programmatic fill: the caller refreshes the preview itself
+        with _signals_blocked(*self.card_fields):
+            self.card_fields[0].setText(card_number)
+            self.card_fields[1].setText(card["card_name"])
+            self.card_fields[2].setText(card["card_due_date"])
+            self.card_fields[3].setText(cvv)
 
     def current_card_country_and_data(self):
         idx = self.card_combo.currentIndex()
         if not (0 <= idx < len(self.flat_cards)):
             return None, None, None
-        display, country, card = self.flat_cards[idx]
-        customer = self.test_data[country]["customer_data"]
-        return country, card, customer
+        return self.flat_countries[idx], self.flat_cards[idx], self.flat_customers[idx]
 
     def update_payload_preview(self):
         """Regenerate the payload preview based on current UI state.
@@ -1147,9 +1878,6 @@ class TesterWindow(QMainWindow):
         single source of truth.
         """
 
-        if self._syncing:
-            return  # Prevent feedback loops
-
         country, card, customer = self.current_card_country_and_data()
         if not card:
             return
@@ -1170,8 +1898,9 @@ class TesterWindow(QMainWindow):
         }
 
         # Start from saved custom payload (if any) so we don't discard user tuning
+        payload = None
         if card.get("custom_payload"):
-            payload = copy.deepcopy(card["custom_payload"])
+            payload = self._clone_custom_payload(card["custom_payload"])
             try:
                 payload["payment"]["card"].update(ui_card)
                 # Always use the current API key from UI, never from saved payload
@@ -1185,32 +1914,122 @@ class TesterWindow(QMainWindow):
                     del payload["payment"]["card"]["soft_descriptor"]
             except (KeyError, TypeError):
                 # Fallback to rebuilding if structure is unexpected
-                payload = self.build_payload(country, ui_card, customer)
+                payload = None
+
+        # Any debounced preview/payload sync is superseded by this rebuild
+        self._preview_timer.stop()
+        self._payload_parse_timer.stop()
+
+        if payload is None:
+            # Default payload: build the display version straight away. The
+            # JSON text is memoized, so a refresh with unchanged inputs ends here.
+            display_card = ui_card
+            display_key = self.key_edit.text() or "{integration_key}"
+            if self.privacy_mode_checkbox.isChecked():
+                display_card = dict(ui_card, card_number=card_number_for_display, card_cvv=cvv_for_display)
+                if self._original_api_key:
+                    display_key = self.mask_api_key(self._original_api_key)
+            text = self.build_payload_text(country, display_card, customer, display_key)
+            if text == self._last_payload_text and text == self.payload_edit.toPlainText():
+                return
+            # The same payload as a dict for the patch/compare path – built
+            # directly rather than parsed back out of *text*
+            display_payload = _build_payload_dict(display_key, customer, display_card,
+                                                  self._default_soft_descriptor())
         else:
-            payload = self.build_payload(country, ui_card, customer)
-
-        # Create display version with masked card number, CVV, and API key if privacy mode is enabled
-        display_payload = copy.deepcopy(payload)
-        if self.privacy_mode_checkbox.isChecked():
-            display_payload["payment"]["card"]["card_number"] = card_number_for_display
-            display_payload["payment"]["card"]["card_cvv"] = cvv_for_display
-            # Mask API key in payload display
-            if hasattr(self, '_original_api_key') and self._original_api_key:
-                display_payload["integration_key"] = self.mask_api_key(self._original_api_key)
+            # Create display version with masked card number, CVV, and API key if privacy mode is enabled
+            text = None
+            display_payload = payload
+            if self.privacy_mode_checkbox.isChecked():
+                display_payload = self._mask_payload(payload, card_number_for_display, cvv_for_display)
+
+        # Block the editor's signals so setting the text doesn't feed back into the form
+        with _signals_blocked(self.payload_edit):
+            if not self._patch_payload_preview(display_payload):
+                if text is not None:
+                    self.payload_edit.setPlainText(text)
+                else:
+                    self.payload_edit.set_json_text(display_payload)
+            self._last_payload = display_payload
+            self._last_payload_text = self.payload_edit.toPlainText()
+
+    def _clone_custom_payload(self, payload: Dict) -> Dict:
+        """Return a fresh, mutable copy of a saved payload (a card's custom
+        payload or an APM profile's payload template).
+
+        Saved payloads are plain JSON, so parsing a cached serialization is
+        far cheaper than ``copy.deepcopy`` on every preview update. The cache
+        keeps a reference to the source dict so a recycled ``id`` can never
+        return another payload's JSON.
+        """
+        cached = self._custom_payload_json.get(id(payload))
+        if cached is None or cached[0] is not payload:
+            cached = (payload, _json_dumps(payload))
+            self._custom_payload_json[id(payload)] = cached
+        return _json_loads(cached[1])
+
+    def _mask_payload(self, payload: Dict, card_number: str, card_cvv: str) -> Dict:
+        """Return the privacy-mode display copy of *payload*.
+
+        Only the dicts on the ``payment.card`` path (and the top level, for
+        the masked API key) are copied; the rest is shared with *payload*,
+        which is never mutated.
+        """
+        display = dict(payload)
+        display["payment"] = dict(payload["payment"])
+        display["payment"]["card"] = {
+            **payload["payment"]["card"], "card_number": card_number, "card_cvv": card_cvv,
+        }
+        # Mask API key in payload display
+        if self._original_api_key:
+            display["integration_key"] = self.mask_api_key(self._original_api_key)
+        return display
+
+    def _store_custom_payload(self, card: Dict, key: str, payload: Dict) -> None:
+        """Set ``card[key]`` to *payload*, dropping the cached JSON of the old one."""
+        old = card.get(key)
+        if old is not None:
+            self._custom_payload_json.pop(id(old), None)
+        card[key] = payload
+
+    def _patch_payload_preview(self, payload: Dict) -> bool:
+        """Update only the changed ``payment.card`` values and top-level
+        ``integration_key`` in the payload editor.
+
+        Returns False when a full rebuild is required: first render, anything
+        else changed, or the editor no longer holds the text we last emitted
+        (e.g. the user edited or reformatted it).
+        """
+        old = self._last_payload
+        if old is None or self.payload_edit.toPlainText() != self._last_payload_text:
+            return False
+        try:
+            old_card = old["payment"]["card"]
+            new_card = payload["payment"]["card"]
+            if list(old_card) != list(new_card):
+                return False
+            if list(old) != list(payload):
+                return False
+            if ({**old, "payment": None, "integration_key": None}
+                    != {**payload, "payment": None, "integration_key": None}):
+                return False
+            if {**old["payment"], "card": None} != {**payload["payment"], "card": None}:
+                return False
+        except (KeyError, TypeError):
+            return False
 
-        # Temporarily block signals to avoid recursive updates when we set text
-        self._syncing = True
-        self.payload_edit.set_json_text(display_payload)
-        self._syncing = False
+        changes = [(k, old_card[k], v) for k, v in new_card.items() if v != old_card[k]]
+        if old.get("integration_key") != payload.get("integration_key"):
+            changes.append(("integration_key", old.get("integration_key"), payload.get("integration_key")))
+        if not changes:
+            return True
+        return self.payload_edit.replace_json_values(changes)
 
     # ------------------------------------------------------------------
     # Sync helpers
     # ------------------------------------------------------------------
     def on_card_field_changed(self):
         """Called whenever the user edits one of the card QLineEdits."""
-        if self._syncing:
-            return
-        
         # If privacy mode is enabled and user is editing the card number field,
         # we need to handle this specially since the field shows masked data
         if (self.privacy_mode_checkbox.isChecked() and 
@@ -1220,73 +2039,77 @@ class TesterWindow(QMainWindow):
             # or provide a way to edit the original. For now, just update normally.
             pass
         
-        self.update_payload_preview()
+        self._preview_timer.start()
+
+    def _flush_pending_sync(self):
+        """Apply any debounced card-form/payload sync before the payload is read."""
+        if self._payload_parse_timer.isActive():
+            self._payload_parse_timer.stop()
+            self._do_payload_sync()
+        if self._preview_timer.isActive():
+            self.update_payload_preview()
 
     def on_api_key_changed(self):
         """Called when the API key field changes - update payload and save config."""
-        if self._syncing:
-            return
-        
         # Store the original API key for privacy mode masking
         if not self.privacy_mode_checkbox.isChecked():
             self._original_api_key = self.key_edit.text()
         
-        self.update_payload_preview()
+        # Debounced like the card fields; the rebuild then patches just the
+        # "integration_key" line in place rather than re-rendering the payload
+        self._preview_timer.start()
         self._persist_settings()
 
     def on_soft_descriptor_changed(self):
         """Called when the soft descriptor field or checkbox changes - update payload and save config."""
-        if self._syncing:
-            return
-        self.update_payload_preview()
+        # Debounced like the other form fields: typing a descriptor rebuilds
+        # the preview once the user pauses, not on every keystroke
+        self._preview_timer.start()
         self._persist_settings()
 
     def mask_card_number(self, card_number: str) -> str:
         """Mask card number showing only first 6 digits followed by asterisks."""
-        if not card_number or len(card_number) < 6:
+        if not card_number:
             return card_number
-        return card_number[:6] + "*" * (len(card_number) - 6)
+        return _mask_middle(card_number, 6, 0)
 
     def mask_cvv(self, cvv: str) -> str:
         """Mask CVV showing only asterisks."""
         if not cvv:
             return cvv
-        return "*" * len(cvv)
+        return _mask_middle(cvv, 0, 0)
 
     def mask_api_key(self, api_key: str) -> str:
         """Mask API key showing only first 4 and last 4 characters with asterisks in between."""
-        if not api_key or len(api_key) < 8:
+        if not api_key:
             return api_key
-        return api_key[:4] + "*" * (len(api_key) - 8) + api_key[-4:]
+        return _mask_middle(api_key, 4, 4)
 
     def on_privacy_mode_changed(self):
         """Called when privacy mode checkbox is toggled - update displays and save config."""
-        if self._syncing:
-            return
-        
         # Update card number and CVV field read-only state based on privacy mode
         is_privacy_enabled = self.privacy_mode_checkbox.isChecked()
         self.card_fields[0].setReadOnly(is_privacy_enabled)
         self.card_fields[3].setReadOnly(is_privacy_enabled)
-        if hasattr(self, 'card_fields_3ds'):
+        if self.card_fields_3ds is not None:
             self.card_fields_3ds[0].setReadOnly(is_privacy_enabled)
             self.card_fields_3ds[3].setReadOnly(is_privacy_enabled)
         
         # Make payload editors read-only when privacy mode is enabled
         self.payload_edit.setReadOnly(is_privacy_enabled)
-        if hasattr(self, 'payload_edit_3ds'):
+        if self.payload_edit_3ds is not None:
             self.payload_edit_3ds.setReadOnly(is_privacy_enabled)
         
         # Handle API key masking
         if is_privacy_enabled:
             # Store the original API key and show masked version
-            if not hasattr(self, '_original_api_key') or not self._original_api_key:
+            if not self._original_api_key:
                 self._original_api_key = self.key_edit.text()
             self.key_edit.setText(self.mask_api_key(self._original_api_key))
             self.key_edit.setReadOnly(True)
         else:
             # Restore original API key and make editable
-            if hasattr(self, '_original_api_key') and self._original_api_key:
+            if self._original_api_key:
                 self.key_edit.setText(self._original_api_key)
             self.key_edit.setReadOnly(False)
             # Update the stored original key to current value when privacy mode is disabled
@@ -1295,66 +2118,65 @@ class TesterWindow(QMainWindow):
         # Refresh current card display to apply masking immediately
         current_idx = self.card_combo.currentIndex()
         if 0 <= current_idx < len(self.flat_cards):
-            _, _, current_card = self.flat_cards[current_idx]
+            current_card = self.flat_cards[current_idx]
             self.apply_card_to_form(current_card)
         
         # Also refresh 3DS tab if it exists
-        if hasattr(self, 'card_combo_3ds'):
+        if self.card_combo_3ds is not None:
             current_idx_3ds = self.card_combo_3ds.currentIndex()
             if 0 <= current_idx_3ds < len(self.flat_cards_3ds):
-                _, _, current_card_3ds = self.flat_cards_3ds[current_idx_3ds]
+                current_card_3ds = self.flat_cards_3ds[current_idx_3ds]
                 self.apply_card_to_form_3ds(current_card_3ds)
         
         self.update_payload_preview()
         # Also update 3DS tab if it exists
-        if hasattr(self, 'update_payload_preview_3ds'):
+        if self.card_combo_3ds is not None:
             self.update_payload_preview_3ds()
         self._persist_settings()
 
     def on_payload_changed(self):
+        """Schedule a payload -> form sync once the user pauses typing."""
+        self._payload_parse_timer.start()
+
+    def _do_payload_sync(self):
         """Keep card form fields and API key in sync when the payload editor changes.
 
-        We attempt to parse the JSON on each change. On valid JSON we extract
-        the card block and update form fields. We also sync the integration_key
-        from the payload to the UI field. This direction-of-sync ensures
-        that manual edits in the JSON view are reflected back in the card
+        We attempt to parse the JSON after each (debounced) edit. On valid JSON
+        we extract the card block and update form fields. We also sync the
+        integration_key from the payload to the UI field. This direction-of-sync
+        ensures that manual edits in the JSON view are reflected back in the card
         selector UI and API key field.
         """
-        if self._syncing:
-            return
-
-        data = self.payload_edit.get_json_data()
+        data = self.payload_edit.json_data_if_changed()
         if not data:
-            return  # Invalid / incomplete JSON – ignore until valid
+            return  # Invalid / incomplete JSON, or already synced – ignore
 
-        self._syncing = True
-        
-        # Update card form fields
-        try:
-            card_data = data["payment"]["card"]
-            for fld, key in zip(self.card_fields, ["card_number", "card_name", "card_due_date", "card_cvv"]):
-                fld.setText(str(card_data.get(key, "")))
-        except (KeyError, TypeError):
-            pass  # Card data not available or structure unexpected
-        
-        # Update API key field if present in payload
-        if "integration_key" in data:
-            api_key = data["integration_key"]
-            if api_key and api_key != "{integration_key}":
-                self.key_edit.setText(str(api_key))
+        with _signals_blocked(*self.card_fields, self.key_edit,
+                              self.soft_descriptor_edit, self.soft_descriptor_checkbox):
+            # Update card form fields
+            try:
+                card_data = data["payment"]["card"]
+                for fld, key in zip(self.card_fields, ["card_number", "card_name", "card_due_date", "card_cvv"]):
+                    fld.setText(str(card_data.get(key, "")))
+            except (KeyError, TypeError):
+                pass  # Card data not available or structure unexpected
         
-        # Update soft descriptor settings from payload
-        try:
-            card_data = data["payment"]["card"]
-            if "soft_descriptor" in card_data:
-                self.soft_descriptor_edit.setText(str(card_data["soft_descriptor"]))
-                self.soft_descriptor_checkbox.setChecked(True)
-            else:
-                self.soft_descriptor_checkbox.setChecked(False)
-        except (KeyError, TypeError):
-            pass  # Card data not available or structure unexpected
+            # Update API key field if present in payload
+            if "integration_key" in data:
+                api_key = data["integration_key"]
+                if api_key and api_key != "{integration_key}":
+                    self.key_edit.setText(str(api_key))
         
-        self._syncing = False
+            # Update soft descriptor settings from payload
+            try:
+                card_data = data["payment"]["card"]
+                if "soft_descriptor" in card_data:
+                    self.soft_descriptor_edit.setText(str(card_data["soft_descriptor"]))
+                    self.soft_descriptor_checkbox.setChecked(True)
+                else:
+                    self.soft_descriptor_checkbox.setChecked(False)
+            except (KeyError, TypeError):
+                pass  # Card data not available or structure unexpected
 
     def format_payload_json(self):
         """Format the payload JSON."""
@@ -1370,57 +2192,69 @@ class TesterWindow(QMainWindow):
     # ------------------------------------------------------------------
     # API interaction
     # ------------------------------------------------------------------
-    def build_payload(self, country: str, card: Dict, customer: Dict):
-        payload = {
-            "integration_key": self.key_edit.text() or "{integration_key}",
-            "operation": "request",
-            "payment": {
-                "amount_total": customer["default_amount"],
-                "currency_code": customer["currency_code"],
-                "name": customer["name"],
-                "email": customer["email"],
-                "birth_date": customer["birth_date"],
-                "country": customer["country"],
-                "phone_number": customer["phone_number"],
-                "card": {
-                    "card_number": card["card_number"],
-                    "card_name": card["card_name"],
-                    "card_due_date": card["card_due_date"],
-                    "card_cvv": card["card_cvv"],
-                    "auto_capture": True,
-                    "threeds_force": False,
-                },
-            },
-        }
+    def build_payload_text(self, country: str, card: Dict, customer: Dict, integration_key: str) -> str:
+        """Return the default payload for *card*/*customer* as indented JSON text."""
+        customer_json = self._customer_json.get(country)
+        if customer_json is None:
+            customer_json = self._customer_json[country] = _customer_payment_json(customer)
+        return _build_payload_json(
+            integration_key,
+            customer_json,
+            (card["card_number"], card["card_name"], card["card_due_date"], card["card_cvv"]),
+            self._default_soft_descriptor(),
+        )
 
-        # Add soft descriptor to card object if checkbox is checked
-        if self.soft_descriptor_checkbox.isChecked() and self.soft_descriptor_edit.text().strip():
-            payload["payment"]["card"]["soft_descriptor"] = self.soft_descriptor_edit.text().strip()
+    def _default_soft_descriptor(self) -> str:
+        """Soft descriptor for the default payload ("" when not in use)."""
+        if self.soft_descriptor_checkbox.isChecked():
+            return self.soft_descriptor_edit.text().strip()
+        return ""
 
-        return payload
+    def build_payload(self, country: str, card: Dict, customer: Dict):
+        integration_key = self.key_edit.text() or "{integration_key}"
+        return _build_payload_dict(integration_key, customer, card, self._default_soft_descriptor())
 
-    def _build_curl_command(self, url: str, ptp: str, payload) -> str:
-        """Return a formatted multi-line cURL command for debugging purposes."""
-        import json  # local import to avoid issues if module name is shadowed
+    def _index_customer_json(self):
+        """Pre-serialize each country's customer fields (see _customer_payment_json)."""
+        self._customer_json = {}
+        for country, data in self.test_data.items():
+            customer = data.get("customer_data")
+            if customer:
+                try:
+                    self._customer_json[country] = _customer_payment_json(customer)
+                except KeyError:
+                    pass  # Incomplete profile – surfaces when the card is selected
+
+    def _show_request_preview(self, edit: QPlainTextEdit, curl_cmd: Optional[str]) -> None:
+        """Append the cURL preview (or the privacy notice when *curl_cmd* is None)."""
+        if curl_cmd is None:
+            edit.appendPlainText("🔒 Privacy Mode: cURL command hidden\n\n⏳ Waiting for response...\n")
+        else:
+            edit.appendPlainText(f"🔧 cURL Command:\n\n{curl_cmd}\n\n\n⏳ Waiting for response...\n")
+
+    def _build_curl_command(self, url: str, ptp: str, body: str) -> str:
+        """Return a formatted multi-line cURL command for debugging purposes.
 
-        json_str = json.dumps(payload, separators=(',', ':'))
-        # Escape any single quotes in the JSON so the command remains valid inside single quotes
-        json_str = json_str.replace("'", "'\"'\"'")
+        *body* is the serialized JSON exactly as it is sent to the API.
+        """
+        # shlex.quote wraps the JSON in single quotes and escapes any embedded ones
+        json_arg = shlex.quote(body)
 
         cmd = (
             f"curl -X POST '{url}' \\\n"  # newline retained
             f"  -H 'Content-Type: application/json' \\\n"  # newline retained
             f"  -H 'X-EBANX-Custom-Payment-Type-Profile: {ptp}' \\\n"  # newline retained
-            f"  -d '{json_str}'"
+            f"  -d {json_arg}"
         )
         return cmd
 
     def save_payload_for_card(self):
+        self._flush_pending_sync()
         idx = self.card_combo.currentIndex()
         if not (0 <= idx < len(self.flat_cards)):
             QMessageBox.warning(self, "No card selected", "Select a card first.")
             return
-        _, _, card = self.flat_cards[idx]
+        card = self.flat_cards[idx]
         
         payload_data = self.payload_edit.get_json_data()
         if payload_data is None:
@@ -1432,12 +2266,13 @@ class TesterWindow(QMainWindow):
         if "integration_key" in payload_data:
             del payload_data["integration_key"]
 
-        card["custom_payload"] = payload_data
+        self._store_custom_payload(card, "custom_payload", payload_data)
         self._write_cards_file()
         QMessageBox.information(self, "Saved", "Payload saved as part of card profile (API key excluded).")
 
     def run_test(self):
         self.logger.info("Starting API test")
+        self._flush_pending_sync()
         
         country, card, customer = self.current_card_country_and_data()
         if not card:
@@ -1470,115 +2305,88 @@ class TesterWindow(QMainWindow):
             payload_data["payment"]["card"]["card_number"] = card["card_number"]
             payload_data["payment"]["card"]["card_cvv"] = card["card_cvv"]
             # Use original API key
-            if hasattr(self, '_original_api_key') and self._original_api_key:
+            if self._original_api_key:
                 payload_data["integration_key"] = self._original_api_key
-                self.logger.info(f"Privacy mode: Using original API key (masked for log)")
+                self.logger.info("Privacy mode: Using original API key (masked for log)")
             else:
                 self.logger.warning("Privacy mode enabled but no original API key found")
         else:
             # Ensure we always have the current API key from the UI field
             payload_data["integration_key"] = self.key_edit.text() or "{integration_key}"
 
+        # Serialize once: the same compact JSON feeds the cURL preview and the request body
+        body = _json_dumpb(payload_data)
+
         headers = {
             "Content-Type": "application/json",
-            "User-Agent": "EBANX-PTP-Tester/Qt",
             "X-EBANX-Custom-Payment-Type-Profile": ptp,
         }
         url = f"{self.base_url_edit.text().rstrip('/')}/ws/direct"
         
-        self.logger.info(f"Making API call to {url} with PTP: {ptp}")
-        self.logger.info(f"Card: {card.get('description', 'Unknown')}")
-        self.logger.info(f"Country: {country}")
+        self.logger.info("Making API call to %s with PTP: %s", url, ptp)
+        self.logger.info("Card: %s", card.get('description', 'Unknown'))
+        self.logger.info("Country: %s", country)
 
-        # ------------------------------------------------------------------
-        # Observability – show the cURL command first (unless privacy mode is enabled)
-        # ------------------------------------------------------------------
         self.run_btn.setEnabled(False)
 
-        # Only show cURL command if privacy mode is disabled
-        if not self.privacy_mode_checkbox.isChecked():
-            curl_cmd = self._build_curl_command(url, ptp, payload_data)
-            self.response_edit.appendPlainText("🔧 cURL Command:\n")
-            self.response_edit.appendPlainText(curl_cmd)
-            self.response_edit.appendPlainText("\n\n⏳ Waiting for response...\n")
-        else:
-            self.response_edit.appendPlainText("🔒 Privacy Mode: cURL command hidden\n")
-            self.response_edit.appendPlainText("⏳ Waiting for response...\n")
-        QApplication.processEvents()
-
-        # Prepare header that will be shown once the response is available
-        request_info = (
-            f"🌐 POST {url}\n"
-            f"📋 PTP: {ptp}\n"
-            f"💳 Card: {card['description']}\n"
-            f"⏰ {datetime.now().strftime('%H:%M:%S')}\n"
-            + "─" * 50 + "\n"
-        )
+        # Remember what the header shown with a non-JSON/error response needs;
+        # it is only formatted if one of those paths actually uses it
+        request_ctx = (url, ptp, f"💳 Card: {card['description']}\n", datetime.now())
  
-        # Create a worker and a QThread to run the network request without blocking the UI
-        self._api_thread = QThread(self)  # Keep reference as attribute
-        worker = APICallWorker(url, payload_data, headers)
-        worker.moveToThread(self._api_thread)
-        self._api_worker = worker  # Prevent garbage collection
-
-        # Wire up signals
-        self._api_thread.started.connect(worker.run)
-        worker.finished.connect(self._handle_api_response)
-        worker.error.connect(self._handle_api_error)
-
-        # Ensure thread stops/cleans up
-        worker.finished.connect(self._api_thread.quit)
-        worker.error.connect(self._api_thread.quit)
-        self._api_thread.finished.connect(worker.deleteLater)
-        self._api_thread.finished.connect(self._api_thread.deleteLater)
-
-        # Persist request info for handlers
-        self._latest_request_info = request_info
+        # Run the network request on a pooled thread without blocking the UI
+        worker = APICallWorker(url, body, headers,
+                               pretty=self.pretty_response_checkbox.isChecked())
+        worker.signals.finished.connect(self._handle_api_response)
+        worker.signals.error.connect(self._handle_api_error)
+        self._api_worker = worker  # Prevent garbage collection until handled
+
+        # Persist request context for handlers
+        self._latest_request_ctx = request_ctx
+
+        # Render the cURL preview (unless privacy mode is enabled) once control
+        # is back in the event loop, while the request is already in flight.
+        # Queued before the worker starts so it always lands ahead of the response.
+        if self.privacy_mode_checkbox.isChecked():
+            self._show_request_preview(self.response_edit, None)
+        else:
+            QTimer.singleShot(0, lambda: self._show_request_preview(
+                self.response_edit, self._build_curl_command(url, ptp, body.decode("utf-8"))))
 
         # Start the background job
-        self._api_thread.start()
+        QThreadPool.globalInstance().start(worker)
 
-    def _handle_api_response(self, resp):
-        self.logger.info(f"API response received: {resp.status_code} {resp.reason}")
-        
-        # Append response header below the existing cURL preview so it's not lost
-        self.response_edit.appendPlainText("\n" + self._latest_request_info)
+    def _status_text(self, resp, label: str) -> str:
+        """Log *resp*'s status under *label* and return the status lines for the pane."""
+        tag, level, message = _STATUS_CLASSES.get(min(resp.status_code // 100, 5), _STATUS_OTHER)
+        self.logger.log(level, message, {"label": label, "code": resp.status_code})
+        return f"📊 Status: {resp.status_code} {resp.reason}\n{tag}"
+
+    def _handle_api_response(self, resp, body: ResponseBody):
+        self.logger.info("API response received: %s %s", resp.status_code, resp.reason)
         
         # Enhanced response display with status color coding
-        status_text = f"📊 Status: {resp.status_code} {resp.reason}\n"
-        if resp.status_code >= 200 and resp.status_code < 300:
-            status_text += "✅ Success\n"
-            self.logger.info("API call successful")
-        elif resp.status_code >= 400 and resp.status_code < 500:
-            status_text += "❌ Client Error\n"
-            self.logger.warning(f"API client error: {resp.status_code}")
-        elif resp.status_code >= 500:
-            status_text += "🔥 Server Error\n"
-            self.logger.error(f"API server error: {resp.status_code}")
-        else:
-            status_text += "⚠️  Other Status\n"
-            self.logger.warning(f"API unexpected status: {resp.status_code}")
-        
-        self.response_edit.appendPlainText(status_text)
+        status_text = self._status_text(resp, "API")
         
-        try:
-            response_data = resp.json()
-            self.response_edit.appendPlainText("📄 Response Body:\n")
-            self.response_edit.set_json_text(response_data)
-        except ValueError:
-            self.response_edit.appendPlainText("📄 Response Text:\n")
-            self.response_edit.appendPlainText(resp.text)
+        # The body was already parsed and formatted by the worker. Each editor
+        # update is a single call so the editor is laid out/repainted once.
+        if body.is_json:
+            # The formatted body replaces the editor contents
+            self.response_edit.setPlainText(body.text)
+        else:
+            # Append response header below the existing cURL preview so it's not lost
+            self.response_edit.appendPlainText("\n".join((
+                "\n" + _format_request_info(self._latest_request_ctx), status_text, "📄 Response Text:\n", body.text,
+            )))
                 
         self.run_btn.setEnabled(True)
         # Persist latest settings
         self._persist_settings()
 
     def _handle_api_error(self, error_msg: str):
-        self.logger.error(f"API call failed: {error_msg}")
+        self.logger.error("API call failed: %s", error_msg)
         
         # Append error information below preview
-        self.response_edit.appendPlainText("\n" + self._latest_request_info)
-        self.response_edit.appendPlainText(f"❌ Error: {error_msg}")
+        self.response_edit.appendPlainText(f"\n{_format_request_info(self._latest_request_ctx)}\n❌ Error: {error_msg}")
         self.run_btn.setEnabled(True)
         # Persist latest settings
         self._persist_settings()
@@ -1587,20 +2395,19 @@ class TesterWindow(QMainWindow):
     # PTP filter helper
     # ------------------------------------------------------------------
     def update_ptp_filter(self, text: str):
-        """Filter the PTP combo box items based on *text*."""
-        text = text.strip().lower()
+        """Schedule re-filtering of the PTP combo once the user pauses typing."""
+        self._ptp_filter_timers[""].start()
+
+    def _apply_ptp_filter(self):
+        """Filter the PTP combo box items based on the filter box text."""
+        text = self.ptp_filter_edit.text()
         current = self.ptp_combo.currentText()
-        self.ptp_combo.blockSignals(True)
-        self.ptp_combo.clear()
-        if text:
-            filtered = [ptp for ptp in self.ptp_list if text in ptp.lower()]
-        else:
-            filtered = self.ptp_list
-        self.ptp_combo.addItems(filtered)
-        self.ptp_combo.blockSignals(False)
+        with _signals_blocked(self.ptp_combo):
+            self._ptp_proxy.setFilterFixedString(text.strip())
         # Try to keep previous selection if still available, else select first
-        if current in filtered:
-            self.ptp_combo.setCurrentText(current)
+        idx = self.ptp_combo.findText(current)
+        if idx >= 0:
+            self.ptp_combo.setCurrentIndex(idx)
         elif self.ptp_combo.count():
             self.ptp_combo.setCurrentIndex(0)
 
@@ -1612,11 +2419,15 @@ class TesterWindow(QMainWindow):
     # Config persistence helpers
     # ------------------------------------------------------------------
     def _persist_settings(self):
+        """Schedule a config save; bursts of changes collapse into one write."""
+        self._settings_timer.start()
+
+    def _save_settings(self):
         # When privacy mode is enabled, use original values instead of masked UI values
         # to prevent data loss
         if self.privacy_mode_checkbox.isChecked():
             # Use original API key if available, otherwise don't save it
-            api_key_to_save = getattr(self, '_original_api_key', self.key_edit.text())
+            api_key_to_save = self._original_api_key
         else:
             # Use current UI value when privacy mode is disabled
             api_key_to_save = self.key_edit.text()
@@ -1627,16 +2438,28 @@ class TesterWindow(QMainWindow):
             "soft_descriptor": self.soft_descriptor_edit.text(),
             "use_soft_descriptor": self.soft_descriptor_checkbox.isChecked(),
             "privacy_mode": self.privacy_mode_checkbox.isChecked(),
-            "last_ptp": self.ptp_combo.currentText() if hasattr(self, 'ptp_combo') else "",
-            "last_ptp_3ds": self.ptp_combo_3ds.currentText() if hasattr(self, 'ptp_combo_3ds') else "",
-            "last_ptp_apm": self.ptp_combo_apm.currentText() if hasattr(self, 'ptp_combo_apm') else "",
-            "last_card_index": self.card_combo.currentIndex() if hasattr(self, 'card_combo') else 0,
-            "last_card_index_3ds": self.card_combo_3ds.currentIndex() if hasattr(self, 'card_combo_3ds') else 0,
+            "pretty_responses": self.pretty_response_checkbox.isChecked(),
+            "last_ptp": self.ptp_combo.currentText(),
+            # Tabs not built yet (never opened) keep their saved selections
+            "last_ptp_3ds": self.ptp_combo_3ds.currentText() if self.ptp_combo_3ds is not None else self.cfg.get("last_ptp_3ds", ""),
+            "last_ptp_apm": self.ptp_combo_apm.currentText() if self.ptp_combo_apm is not None else self.cfg.get("last_ptp_apm", ""),
+            "last_card_index": self.card_combo.currentIndex(),
+            "last_card_index_3ds": self.card_combo_3ds.currentIndex() if self.card_combo_3ds is not None else self.cfg.get("last_card_index_3ds", 0),
         })
 
     def _find_card_path(self, target_card):
         """Return tuple (country, card_type, index) where *target_card* resides.
         Returns (None, None, None) if not found."""
+        # O(1) via the index built by flatten_cards; verified against the live
+        # data in case it changed since, with the full scan as the fallback
+        path = self._card_index.get(id(target_card))
+        if path is not None:
+            country, card_type, idx = path
+            try:
+                if self.test_data[country]["debitcard"][card_type][idx] is target_card:
+                    return path
+            except (KeyError, IndexError, TypeError):
+                pass
         for country, data in self.test_data.items():
             dc = data.get("debitcard", {})
             for card_type, card_list in dc.items():
@@ -1646,23 +2469,51 @@ class TesterWindow(QMainWindow):
         return None, None, None
 
     def _write_cards_file(self):
-        """Persist current *self.test_data* structure to *CARDS_FILE*."""
+        """Persist current *self.test_data* structure to *CARDS_FILE*.
+
+        The file is written as compact JSON (use Export Pretty for a readable
+        copy). The data is serialized here, while it can't change underneath us;
+        the atomic write itself runs on the single-threaded file pool so saves
+        land in order without blocking the UI.
+        """
+        job = FileWriteJob(CARDS_FILE, _json_dumpb(self.test_data))
+        job.signals.error.connect(self._on_cards_write_error)
+        job.signals.finished.connect(self._on_file_write_finished)
+        self._pending_writes.add(job)
+        self._file_pool.start(job)
+
+    def export_cards_pretty(self):
+        """Write an indented copy of the cards data to a user-chosen path."""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Cards", os.path.join(DATA_DIR, "test-cards.pretty.json"), "JSON files (*.json)"
+        )
+        if not path:
+            return
         try:
-            os.makedirs(os.path.dirname(CARDS_FILE), exist_ok=True)
-            with open(CARDS_FILE, "w", encoding="utf-8") as fh:
-                json.dump(self.test_data, fh, indent=2)
+            with open(path, "wb") as fh:
+                fh.write(_json_dumpb(self.test_data, indent=True))
         except OSError as exc:
-            QMessageBox.critical(self, "Save error", f"Could not write cards file: {exc}")
+            QMessageBox.critical(self, "Export error", f"Could not write {path}: {exc}")
+            return
+        self.logger.info("Exported cards to %s", path)
+
+    def _on_cards_write_error(self, error_msg: str):
+        self.logger.error("Could not write cards file: %s", error_msg)
+        QMessageBox.critical(self, "Save error", f"Could not write cards file: {error_msg}")
+
+    def _on_file_write_finished(self, job):
+        self._pending_writes.discard(job)
 
     # ------------------------------------------------------------------
     # Card management actions
     # ------------------------------------------------------------------
     def save_existing_card(self):
+        self._flush_pending_sync()
         idx = self.card_combo.currentIndex()
         if not (0 <= idx < len(self.flat_cards)):
             QMessageBox.warning(self, "No card selected", "Please select a card to save.")
             return
-        _, _, card = self.flat_cards[idx]
+        card = self.flat_cards[idx]
 
         # Update card fields from form
         card["card_number"] = self.card_fields[0].text().strip()
@@ -1675,7 +2526,7 @@ class TesterWindow(QMainWindow):
         if payload_data is None:
             QMessageBox.warning(self, "Invalid JSON", "Payload JSON is invalid and was not saved.")
         else:
-            card["custom_payload"] = payload_data
+            self._store_custom_payload(card, "custom_payload", payload_data)
 
         self._write_cards_file()
         QMessageBox.information(self, "Card saved", "Existing card updated successfully.")
@@ -1683,11 +2534,12 @@ class TesterWindow(QMainWindow):
         self.populate_card_combo()
 
     def save_new_card(self):
+        self._flush_pending_sync()
         idx = self.card_combo.currentIndex()
         if not (0 <= idx < len(self.flat_cards)):
             QMessageBox.warning(self, "No reference card", "Please select a reference card (for country & type) before adding a new one.")
             return
-        _, country, ref_card = self.flat_cards[idx]
+        ref_card = self.flat_cards[idx]
         # Find card type based on reference card position
         country_ref, card_type, _ = self._find_card_path(ref_card)
         if country_ref is None:
@@ -1712,7 +2564,7 @@ class TesterWindow(QMainWindow):
         if payload_data is not None:
             new_card["custom_payload"] = payload_data
 
-        self.test_data[country_ref]["debitcard"].setdefault(card_type, []).append(new_card)
+        self._add_card(country_ref, card_type, new_card)
         self._write_cards_file()
         QMessageBox.information(self, "Card added", "New card added successfully.")
         self.populate_card_combo()
@@ -1724,7 +2576,8 @@ class TesterWindow(QMainWindow):
         if not (0 <= idx < len(self.flat_cards)):
             QMessageBox.warning(self, "No card selected", "Please select a card to delete.")
             return
-        display, _, card = self.flat_cards[idx]
+        display = self.flat_displays[idx]
+        card = self.flat_cards[idx]
         reply = QMessageBox.question(self, "Confirm Delete", f"Delete card '{display}'?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply != QMessageBox.StandardButton.Yes:
             return
@@ -1733,20 +2586,22 @@ class TesterWindow(QMainWindow):
         if country is None:
             QMessageBox.critical(self, "Error", "Could not locate card in data structure.")
             return
-        del self.test_data[country]["debitcard"][card_type][card_idx]
-        # Clean up if list empty
-        if not self.test_data[country]["debitcard"][card_type]:
-            del self.test_data[country]["debitcard"][card_type]
+        self._remove_card(country, card_type, card_idx)
         self._write_cards_file()
         QMessageBox.information(self, "Card deleted", "Card removed successfully.")
         self.populate_card_combo()
 
     def reload_cards_from_disk(self):
+        # Make sure our own queued saves are on disk first
+        self._file_pool.waitForDone()
         try:
             self.test_data = load_json(CARDS_FILE)
         except Exception as exc:
             QMessageBox.critical(self, "Load error", str(exc))
             return
+        self._custom_payload_json.clear()
+        self._index_customer_json()
+        self._rebuild_card_records()
         self.populate_card_combo()
         QMessageBox.information(self, "Reloaded", "Cards reloaded from disk.")
 
@@ -1754,16 +2609,19 @@ class TesterWindow(QMainWindow):
     # 3DS Tab Methods
     # ------------------------------------------------------------------
     def populate_card_combo_3ds(self):
-        self.flat_cards_3ds = self.flatten_cards()
-        self.card_combo_3ds.clear()
-        self.card_combo_3ds.addItems([t[0] for t in self.flat_cards_3ds])
-        if self.flat_cards_3ds:
-            self.card_combo_3ds.setCurrentIndex(0)
-            self.apply_card_to_form_3ds(self.flat_cards_3ds[0][2])
+        (self.flat_displays_3ds, self.flat_countries_3ds,
+         self.flat_cards_3ds, self.flat_customers_3ds) = self.flatten_cards()
+        # Swap the whole list silently, then load the first card once (clear +
+        # addItems fired currentIndexChanged twice and applied the card twice)
+        with _signals_blocked(self.card_combo_3ds):
+            self._card_model_3ds.setStringList(self.flat_displays_3ds)
+            if self.flat_cards_3ds:
+                self.card_combo_3ds.setCurrentIndex(0)
+        self.on_card_changed_3ds(0)
 
     def on_card_changed_3ds(self, idx: int):
         if 0 <= idx < len(self.flat_cards_3ds):
-            _, _, card = self.flat_cards_3ds[idx]
+            card = self.flat_cards_3ds[idx]
             self.apply_card_to_form_3ds(card)
             self.update_payload_preview_3ds()
 
@@ -1775,23 +2633,24 @@ class TesterWindow(QMainWindow):
             card_number = self.mask_card_number(card_number)
             cvv = self.mask_cvv(cvv)
         
-        self.card_fields_3ds[0].setText(card_number)
-        self.card_fields_3ds[1].setText(card["card_name"])
-        self.card_fields_3ds[2].setText(card["card_due_date"])
-        self.card_fields_3ds[3].setText(cvv)
+        # Programmatic fill: the caller refreshes the preview itself
+        with _signals_blocked(*self.card_fields_3ds):
+            self.card_fields_3ds[0].setText(card_number)
+            self.card_fields_3ds[1].setText(card["card_name"])
+            self.card_fields_3ds[2].setText(card["card_due_date"])
+            self.card_fields_3ds[3].setText(cvv)
 
     def current_card_country_and_data_3ds(self):
         idx = self.card_combo_3ds.currentIndex()
         if not (0 <= idx < len(self.flat_cards_3ds)):
             return None, None, None
-        display, country, card = self.flat_cards_3ds[idx]
-        customer = self.test_data[country]["customer_data"]
-        return country, card, customer
+        return self.flat_countries_3ds[idx], self.flat_cards_3ds[idx], self.flat_customers_3ds[idx]
 
     def update_payload_preview_3ds(self):
         """Regenerate the payload preview based on current UI state for 3DS tab."""
-        if self._syncing:
-            return  # Prevent feedback loops
+        # Any debounced preview/payload sync is superseded by this rebuild
+        self._preview_timer_3ds.stop()
+        self._payload_parse_timer_3ds.stop()
 
         country, card, customer = self.current_card_country_and_data_3ds()
         if not card:
@@ -1814,7 +2673,7 @@ class TesterWindow(QMainWindow):
 
         # Start from saved custom payload for 3DS (if any) so we don't discard user tuning
         if card.get("custom_payload_3ds"):
-            payload = copy.deepcopy(card["custom_payload_3ds"])
+            payload = self._clone_custom_payload(card["custom_payload_3ds"])
             try:
                 payload["payment"]["card"].update(ui_card)
                 # Always use the current API key from UI, never from saved payload
@@ -1833,62 +2692,62 @@ class TesterWindow(QMainWindow):
             payload = self.build_payload_3ds(country, ui_card, customer)
 
         # Create display version with masked card number, CVV, and API key if privacy mode is enabled
-        display_payload = copy.deepcopy(payload)
+        display_payload = payload
         if self.privacy_mode_checkbox.isChecked():
-            display_payload["payment"]["card"]["card_number"] = card_number_for_display
-            display_payload["payment"]["card"]["card_cvv"] = cvv_for_display
-            # Mask API key in payload display
-            if hasattr(self, '_original_api_key') and self._original_api_key:
-                display_payload["integration_key"] = self.mask_api_key(self._original_api_key)
+            display_payload = self._mask_payload(payload, card_number_for_display, cvv_for_display)
 
-        # Temporarily block signals to avoid recursive updates when we set text
-        self._syncing = True
-        self.payload_edit_3ds.set_json_text(display_payload)
-        self._syncing = False
+        # Block the editor's signals so setting the text doesn't feed back into the form
+        with _signals_blocked(self.payload_edit_3ds):
+            self.payload_edit_3ds.set_json_text(display_payload)
 
     def on_card_field_changed_3ds(self):
         """Called whenever the user edits one of the card QLineEdits in 3DS tab."""
-        if self._syncing:
-            return
-        self.update_payload_preview_3ds()
+        self._preview_timer_3ds.start()
+
+    def _flush_pending_sync_3ds(self):
+        """Apply any debounced 3DS card-form/payload sync before the payload is read."""
+        if self._payload_parse_timer_3ds.isActive():
+            self._payload_parse_timer_3ds.stop()
+            self._do_payload_sync_3ds()
+        if self._preview_timer_3ds.isActive():
+            self.update_payload_preview_3ds()
 
     def on_payload_changed_3ds(self):
-        """Keep card form fields and API key in sync when the payload editor changes in 3DS tab."""
-        if self._syncing:
-            return
+        """Schedule a 3DS payload -> form sync once the user pauses typing."""
+        self._payload_parse_timer_3ds.start()
 
-        data = self.payload_edit_3ds.get_json_data()
+    def _do_payload_sync_3ds(self):
+        """Keep card form fields and API key in sync when the payload editor changes in 3DS tab."""
+        data = self.payload_edit_3ds.json_data_if_changed()
         if not data:
-            return  # Invalid / incomplete JSON – ignore until valid
+            return  # Invalid / incomplete JSON, or already synced – ignore
 
-        self._syncing = True
-        
-        # Update card form fields
-        try:
-            card_data = data["payment"]["card"]
-            for fld, key in zip(self.card_fields_3ds, ["card_number", "card_name", "card_due_date", "card_cvv"]):
-                fld.setText(str(card_data.get(key, "")))
-        except (KeyError, TypeError):
-            pass  # Card data not available or structure unexpected
-        
-        # Update API key field if present in payload
-        if "integration_key" in data:
-            api_key = data["integration_key"]
-            if api_key and api_key != "{integration_key}":
-                self.key_edit.setText(str(api_key))
+        with _signals_blocked(*self.card_fields_3ds, self.key_edit,
+                              self.soft_descriptor_edit, self.soft_descriptor_checkbox):
+            # Update card form fields
+            try:
+                card_data = data["payment"]["card"]
+                for fld, key in zip(self.card_fields_3ds, ["card_number", "card_name", "card_due_date", "card_cvv"]):
+                    fld.setText(str(card_data.get(key, "")))
+            except (KeyError, TypeError):
+                pass  # Card data not available or structure unexpected
         
-        # Update soft descriptor settings from payload
-        try:
-            card_data = data["payment"]["card"]
-            if "soft_descriptor" in card_data:
-                self.soft_descriptor_edit.setText(str(card_data["soft_descriptor"]))
-                self.soft_descriptor_checkbox.setChecked(True)
-            else:
-                self.soft_descriptor_checkbox.setChecked(False)
-        except (KeyError, TypeError):
-            pass  # Card data not available or structure unexpected
+            # Update API key field if present in payload
+            if "integration_key" in data:
+                api_key = data["integration_key"]
+                if api_key and api_key != "{integration_key}":
+                    self.key_edit.setText(str(api_key))
         
-        self._syncing = False
+            # Update soft descriptor settings from payload
+            try:
+                card_data = data["payment"]["card"]
+                if "soft_descriptor" in card_data:
+                    self.soft_descriptor_edit.setText(str(card_data["soft_descriptor"]))
+                    self.soft_descriptor_checkbox.setChecked(True)
+                else:
+                    self.soft_descriptor_checkbox.setChecked(False)
+            except (KeyError, TypeError):
+                pass  # Card data not available or structure unexpected
 
     def format_payload_json_3ds(self):
         """Format the payload JSON in 3DS tab."""
@@ -1905,26 +2764,14 @@ class TesterWindow(QMainWindow):
 
     def build_payload_3ds(self, country: str, card: Dict, customer: Dict):
         """Build payload for 3DS with auto_capture: false and threeds_force: true."""
+        # Same field order as the old literal; only the leaves vary per call
+        payment = {field: customer[key] for field, key in _PAYMENT_CUSTOMER_KEYS}
+        payment["card"] = {key: card[key] for key in _PAYMENT_CARD_KEYS}
+        payment["card"].update(_3DS_CARD_FLAGS)
         payload = {
             "integration_key": self.key_edit.text() or "{integration_key}",
             "operation": "request",
-            "payment": {
-                "amount_total": customer["default_amount"],
-                "currency_code": customer["currency_code"],
-                "name": customer["name"],
-                "email": customer["email"],
-                "birth_date": customer["birth_date"],
-                "country": customer["country"],
-                "phone_number": customer["phone_number"],
-                "card": {
-                    "card_number": card["card_number"],
-                    "card_name": card["card_name"],
-                    "card_due_date": card["card_due_date"],
-                    "card_cvv": card["card_cvv"],
-                    "auto_capture": False,  # 3DS specific: no auto capture
-                    "threeds_force": True,  # 3DS specific: force 3DS
-                },
-            },
+            "payment": payment,
         }
 
         # Add soft descriptor to card object if checkbox is checked
@@ -1936,6 +2783,7 @@ class TesterWindow(QMainWindow):
     def run_test_3ds(self):
         """Run API test for 3DS tab."""
         self.logger.info("Starting API test for 3DS")
+        self._flush_pending_sync_3ds()
         
         country, card, customer = self.current_card_country_and_data_3ds()
         if not card:
@@ -1968,110 +2816,78 @@ class TesterWindow(QMainWindow):
             payload_data["payment"]["card"]["card_number"] = card["card_number"]
             payload_data["payment"]["card"]["card_cvv"] = card["card_cvv"]
             # Use original API key
-            if hasattr(self, '_original_api_key') and self._original_api_key:
+            if self._original_api_key:
                 payload_data["integration_key"] = self._original_api_key
-                self.logger.info(f"Privacy mode: Using original API key for 3DS (masked for log)")
+                self.logger.info("Privacy mode: Using original API key for 3DS (masked for log)")
             else:
                 self.logger.warning("Privacy mode enabled but no original API key found for 3DS")
         else:
             # Ensure we always have the current API key from the UI field
             payload_data["integration_key"] = self.key_edit.text() or "{integration_key}"
 
+        # Serialize once: the same compact JSON feeds the cURL preview and the request body
+        body = _json_dumpb(payload_data)
+
         headers = {
             "Content-Type": "application/json",
-            "User-Agent": "EBANX-PTP-Tester/Qt",
             "X-EBANX-Custom-Payment-Type-Profile": ptp,
         }
         url = f"{self.base_url_edit.text().rstrip('/')}/ws/direct"
         
-        self.logger.info(f"Making 3DS API call to {url} with PTP: {ptp}")
-        self.logger.info(f"Card: {card.get('description', 'Unknown')}")
-        self.logger.info(f"Country: {country}")
+        self.logger.info("Making 3DS API call to %s with PTP: %s", url, ptp)
+        self.logger.info("Card: %s", card.get('description', 'Unknown'))
+        self.logger.info("Country: %s", country)
 
-        # ------------------------------------------------------------------
-        # Observability – show the cURL command first (unless privacy mode is enabled)
-        # ------------------------------------------------------------------
         self.run_btn_3ds.setEnabled(False)
         # Disable 3DS button when starting new API call
         self.authenticate_3ds_btn_3ds.setEnabled(False)
 
-        # Only show cURL command if privacy mode is disabled
-        if not self.privacy_mode_checkbox.isChecked():
-            curl_cmd = self._build_curl_command(url, ptp, payload_data)
-            self.response_edit_3ds.appendPlainText("🔧 cURL Command:\n")
-            self.response_edit_3ds.appendPlainText(curl_cmd)
-            self.response_edit_3ds.appendPlainText("\n\n⏳ Waiting for response...\n")
-        else:
-            self.response_edit_3ds.appendPlainText("🔒 Privacy Mode: cURL command hidden\n")
-            self.response_edit_3ds.appendPlainText("⏳ Waiting for response...\n")
-        QApplication.processEvents()
-
-        # Prepare header that will be shown once the response is available
-        request_info = (
-            f"🌐 POST {url}\n"
-            f"📋 PTP: {ptp}\n"
-            f"💳 Card: {card['description']}\n"
-            f"🔐 3DS Mode: auto_capture=false, threeds_force=true\n"
-            f"⏰ {datetime.now().strftime('%H:%M:%S')}\n"
-            + "─" * 50 + "\n"
-        )
+        # Remember what the header shown with a non-JSON/error response needs;
+        # it is only formatted if one of those paths actually uses it
+        request_ctx = (url, ptp, f"💳 Card: {card['description']}\n🔐 3DS Mode: auto_capture=false, threeds_force=true\n", datetime.now())
  
-        # Create a worker and a QThread to run the network request without blocking the UI
-        self._api_thread_3ds = QThread(self)  # Keep reference as attribute
-        worker = APICallWorker(url, payload_data, headers)
-        worker.moveToThread(self._api_thread_3ds)
-        self._api_worker_3ds = worker  # Prevent garbage collection
-
-        # Wire up signals
-        self._api_thread_3ds.started.connect(worker.run)
-        worker.finished.connect(self._handle_api_response_3ds)
-        worker.error.connect(self._handle_api_error_3ds)
-
-        # Ensure thread stops/cleans up
-        worker.finished.connect(self._api_thread_3ds.quit)
-        worker.error.connect(self._api_thread_3ds.quit)
-        self._api_thread_3ds.finished.connect(worker.deleteLater)
-        self._api_thread_3ds.finished.connect(self._api_thread_3ds.deleteLater)
-
-        # Persist request info for handlers
-        self._latest_request_info_3ds = request_info
+        # Run the network request on a pooled thread without blocking the UI
+        # The 3DS handler always needs the parsed body to find the auth URL
+        worker = APICallWorker(url, body, headers,
+                               pretty=self.pretty_response_checkbox.isChecked(), need_data=True)
+        worker.signals.finished.connect(self._handle_api_response_3ds)
+        worker.signals.error.connect(self._handle_api_error_3ds)
+        self._api_worker_3ds = worker  # Prevent garbage collection until handled
+
+        # Persist request context for handlers
+        self._latest_request_ctx_3ds = request_ctx
+
+        # Render the cURL preview (unless privacy mode is enabled) once control
+        # is back in the event loop, while the request is already in flight.
+        # Queued before the worker starts so it always lands ahead of the response.
+        if self.privacy_mode_checkbox.isChecked():
+            self._show_request_preview(self.response_edit_3ds, None)
+        else:
+            QTimer.singleShot(0, lambda: self._show_request_preview(
+                self.response_edit_3ds, self._build_curl_command(url, ptp, body.decode("utf-8"))))
 
         # Start the background job
-        self._api_thread_3ds.start()
+        QThreadPool.globalInstance().start(worker)
 
-    def _handle_api_response_3ds(self, resp):
+    def _handle_api_response_3ds(self, resp, body: ResponseBody):
         """Handle API response for 3DS tab."""
-        self.logger.info(f"3DS API response received: {resp.status_code} {resp.reason}")
-        
-        # Append response header below the existing cURL preview so it's not lost
-        self.response_edit_3ds.appendPlainText("\n" + self._latest_request_info_3ds)
+        self.logger.info("3DS API response received: %s %s", resp.status_code, resp.reason)
         
         # Enhanced response display with status color coding
-        status_text = f"📊 Status: {resp.status_code} {resp.reason}\n"
-        if resp.status_code >= 200 and resp.status_code < 300:
-            status_text += "✅ Success\n"
-            self.logger.info("3DS API call successful")
-        elif resp.status_code >= 400 and resp.status_code < 500:
-            status_text += "❌ Client Error\n"
-            self.logger.warning(f"3DS API client error: {resp.status_code}")
-        elif resp.status_code >= 500:
-            status_text += "🔥 Server Error\n"
-            self.logger.error(f"3DS API server error: {resp.status_code}")
-        else:
-            status_text += "⚠️  Other Status\n"
-            self.logger.warning(f"3DS API unexpected status: {resp.status_code}")
+        status_text = self._status_text(resp, "3DS API")
         
-        self.response_edit_3ds.appendPlainText(status_text)
-        
-        try:
-            response_data = resp.json()
-            self.response_edit_3ds.appendPlainText("📄 Response Body:\n")
-            self.response_edit_3ds.set_json_text(response_data)
+        # The body was already parsed and formatted by the worker. Each editor
+        # update is a single call so the editor is laid out/repainted once.
+        if body.is_json:
+            # The formatted body replaces the editor contents
+            self.response_edit_3ds.setPlainText(body.text)
             # Check for 3DS URL and enable/disable authentication button
-            self._check_for_3ds_url_3ds(response_data)
-        except ValueError:
-            self.response_edit_3ds.appendPlainText("📄 Response Text:\n")
-            self.response_edit_3ds.appendPlainText(resp.text)
+            self._check_for_3ds_url_3ds(body.data)
+        else:
+            # Append response header below the existing cURL preview so it's not lost
+            self.response_edit_3ds.appendPlainText("\n".join((
+                "\n" + _format_request_info(self._latest_request_ctx_3ds), status_text, "📄 Response Text:\n", body.text,
+            )))
             # Disable 3DS button if response is not JSON
             self.authenticate_3ds_btn_3ds.setEnabled(False)
                 
@@ -2081,40 +2897,39 @@ class TesterWindow(QMainWindow):
 
     def _handle_api_error_3ds(self, error_msg: str):
         """Handle API error for 3DS tab."""
-        self.logger.error(f"3DS API call failed: {error_msg}")
+        self.logger.error("3DS API call failed: %s", error_msg)
         
         # Append error information below preview
-        self.response_edit_3ds.appendPlainText("\n" + self._latest_request_info_3ds)
-        self.response_edit_3ds.appendPlainText(f"❌ Error: {error_msg}")
+        self.response_edit_3ds.appendPlainText(f"\n{_format_request_info(self._latest_request_ctx_3ds)}\n❌ Error: {error_msg}")
         self.run_btn_3ds.setEnabled(True)
         # Persist latest settings
         self._persist_settings()
 
     def update_ptp_filter_3ds(self, text: str):
-        """Filter the PTP combo box items based on *text* for 3DS tab."""
-        text = text.strip().lower()
+        """Schedule re-filtering of the 3DS PTP combo once the user pauses typing."""
+        self._ptp_filter_timers["_3ds"].start()
+
+    def _apply_ptp_filter_3ds(self):
+        """Filter the PTP combo box items based on the filter box text for 3DS tab."""
+        text = self.ptp_filter_edit_3ds.text()
         current = self.ptp_combo_3ds.currentText()
-        self.ptp_combo_3ds.blockSignals(True)
-        self.ptp_combo_3ds.clear()
-        if text:
-            filtered = [ptp for ptp in self.ptp_list if text in ptp.lower()]
-        else:
-            filtered = self.ptp_list
-        self.ptp_combo_3ds.addItems(filtered)
-        self.ptp_combo_3ds.blockSignals(False)
+        with _signals_blocked(self.ptp_combo_3ds):
+            self._ptp_proxy_3ds.setFilterFixedString(text.strip())
         # Try to keep previous selection if still available, else select first
-        if current in filtered:
-            self.ptp_combo_3ds.setCurrentText(current)
+        idx = self.ptp_combo_3ds.findText(current)
+        if idx >= 0:
+            self.ptp_combo_3ds.setCurrentIndex(idx)
         elif self.ptp_combo_3ds.count():
             self.ptp_combo_3ds.setCurrentIndex(0)
 
     def save_existing_card_3ds(self):
         """Save existing card in 3DS tab."""
+        self._flush_pending_sync_3ds()
         idx = self.card_combo_3ds.currentIndex()
         if not (0 <= idx < len(self.flat_cards_3ds)):
             QMessageBox.warning(self, "No card selected", "Please select a card to save.")
             return
-        _, _, card = self.flat_cards_3ds[idx]
+        card = self.flat_cards_3ds[idx]
 
         # Update card fields from form
         card["card_number"] = self.card_fields_3ds[0].text().strip()
@@ -2127,7 +2942,7 @@ class TesterWindow(QMainWindow):
         if payload_data is None:
             QMessageBox.warning(self, "Invalid JSON", "Payload JSON is invalid and was not saved.")
         else:
-            card["custom_payload_3ds"] = payload_data
+            self._store_custom_payload(card, "custom_payload_3ds", payload_data)
 
         self._write_cards_file()
         QMessageBox.information(self, "Card saved", "Existing card updated successfully.")
@@ -2136,11 +2951,12 @@ class TesterWindow(QMainWindow):
 
     def save_new_card_3ds(self):
         """Save new card in 3DS tab."""
+        self._flush_pending_sync_3ds()
         idx = self.card_combo_3ds.currentIndex()
         if not (0 <= idx < len(self.flat_cards_3ds)):
             QMessageBox.warning(self, "No reference card", "Please select a reference card (for country & type) before adding a new one.")
             return
-        _, country, ref_card = self.flat_cards_3ds[idx]
+        ref_card = self.flat_cards_3ds[idx]
         # Find card type based on reference card position
         country_ref, card_type, _ = self._find_card_path(ref_card)
         if country_ref is None:
@@ -2165,7 +2981,7 @@ class TesterWindow(QMainWindow):
         if payload_data is not None:
             new_card["custom_payload_3ds"] = payload_data
 
-        self.test_data[country_ref]["debitcard"].setdefault(card_type, []).append(new_card)
+        self._add_card(country_ref, card_type, new_card)
         self._write_cards_file()
         QMessageBox.information(self, "Card added", "New card added successfully.")
         self.populate_card_combo_3ds()
@@ -2178,7 +2994,8 @@ class TesterWindow(QMainWindow):
         if not (0 <= idx < len(self.flat_cards_3ds)):
             QMessageBox.warning(self, "No card selected", "Please select a card to delete.")
             return
-        display, _, card = self.flat_cards_3ds[idx]
+        display = self.flat_displays_3ds[idx]
+        card = self.flat_cards_3ds[idx]
         reply = QMessageBox.question(self, "Confirm Delete", f"Delete card '{display}'?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply != QMessageBox.StandardButton.Yes:
             return
@@ -2187,21 +3004,23 @@ class TesterWindow(QMainWindow):
         if country is None:
             QMessageBox.critical(self, "Error", "Could not locate card in data structure.")
             return
-        del self.test_data[country]["debitcard"][card_type][card_idx]
-        # Clean up if list empty
-        if not self.test_data[country]["debitcard"][card_type]:
-            del self.test_data[country]["debitcard"][card_type]
+        self._remove_card(country, card_type, card_idx)
         self._write_cards_file()
         QMessageBox.information(self, "Card deleted", "Card removed successfully.")
         self.populate_card_combo_3ds()
 
     def reload_cards_from_disk_3ds(self):
         """Reload cards from disk for 3DS tab."""
+        # Make sure our own queued saves are on disk first
+        self._file_pool.waitForDone()
         try:
             self.test_data = load_json(CARDS_FILE)
         except Exception as exc:
             QMessageBox.critical(self, "Load error", str(exc))
             return
+        self._custom_payload_json.clear()
+        self._index_customer_json()
+        self._rebuild_card_records()
         self.populate_card_combo_3ds()
         QMessageBox.information(self, "Reloaded", "Cards reloaded from disk.")
 
@@ -2220,7 +3039,7 @@ class TesterWindow(QMainWindow):
                     # Store the URL for later use
                     self._current_3ds_url_3ds = redirect_url
                     self.authenticate_3ds_btn_3ds.setEnabled(True)
-                    self.logger.info(f"3DS URL detected in 3DS tab: {redirect_url}")
+                    self.logger.info("3DS URL detected in 3DS tab: %s", redirect_url)
                     return
             
             # No valid 3DS URL found
@@ -2234,23 +3053,30 @@ class TesterWindow(QMainWindow):
 
     def authenticate_3ds_in_browser_3ds(self):
         """Open 3DS authentication URL in browser for 3DS tab."""
-        if hasattr(self, '_3ds_url_3ds') and self._3ds_url_3ds:
-            try:
-                webbrowser.open(self._3ds_url_3ds)
-                self.logger.info(f"Opened 3DS URL in browser: {self._3ds_url_3ds}")
-            except Exception as exc:
-                self.logger.error(f"Failed to open 3DS URL: {exc}")
-                QMessageBox.warning(self, "Browser Error", f"Failed to open browser: {exc}")
+        url = self._current_3ds_url_3ds
+        if url:
+            # Hands the URL to the platform's URL handler without blocking the
+            # GUI thread (webbrowser.open can stall while it launches a process)
+            if QDesktopServices.openUrl(QUrl(url)):
+                self.logger.info("Opened 3DS URL in browser: %s", url)
+            else:
+                self.logger.error("Failed to open 3DS URL: %s", url)
+                QMessageBox.warning(self, "Browser Error", "Failed to open browser: no handler accepted the URL.")
         else:
             QMessageBox.information(self, "No 3DS URL", "No 3DS authentication URL found in the last response.")
 
     def closeEvent(self, event):
         try:
-            self._persist_settings()
+            # Save now, superseding any scheduled save
+            self._settings_timer.stop()
+            self._save_settings()
         except Exception as exc:
             # Log the error but don't prevent the application from closing
             if hasattr(self, 'logger'):
-                self.logger.error(f"Error during settings persistence: {exc}")
+                self.logger.error("Error during settings persistence: %s", exc)
+        # Let queued card/APM saves finish before the process exits
+        self._file_pool.waitForDone()
+        _close_http_session()
         super().closeEvent(event)
 
     # ------------------------------------------------------------------
@@ -2270,15 +3096,18 @@ class TesterWindow(QMainWindow):
     def populate_apm_combo(self):
         """Populate the APM combo box with available APM profiles."""
         self.apm_flat_list = self.flatten_apms()
-        self.apm_combo.clear()
-        self.apm_combo.addItems([t[0] for t in self.apm_flat_list])
-        if self.apm_flat_list:
-            self.apm_combo.setCurrentIndex(0)
-            self.apply_apm_to_form(self.apm_flat_list[0][4])
+        # Swap the whole list in one model reset, then load the first profile
+        # once (clear + addItems re-laid out the view per row)
+        with _signals_blocked(self.apm_combo):
+            self._apm_model.setStringList([t[0] for t in self.apm_flat_list])
+            if self.apm_flat_list:
+                self.apm_combo.setCurrentIndex(0)
+        self.on_apm_changed(0)
         
         # Also populate PTP combo
-        self.ptp_combo_apm.clear()
-        self.ptp_combo_apm.addItems(self.ptp_list)
+        self._ptp_model_apm.setStringList(self.ptp_list)
+        if self.ptp_list:
+            self.ptp_combo_apm.setCurrentIndex(0)
         
         # Restore last selected PTP for APM tab
         last_ptp = self.cfg.get("last_ptp_apm", "")
@@ -2294,53 +3123,57 @@ class TesterWindow(QMainWindow):
 
     def apply_apm_to_form(self, apm_data: Dict):
         """Apply APM data to form fields."""
-        payload = apm_data.get("payload", {})
-        
-        # Clear all fields first
-        for field in self.apm_form_fields:
-            field.clear()
-        
-        # Apply payment data if it exists
-        payment_data = payload.get("payment", {})
-        if payment_data:
-            # Map payment fields to form fields
-            field_mapping = {
-                "name": "name",
-                "email": "email", 
-                "phone_number": "phone_number",
-                "country": "country",
-                "payment_type_code": "payment_type_code",
-                "currency_code": "currency_code",
-                "amount_total": "amount_total",
-                "document": "document"
-            }
+        # Programmatic fill: block the fields' textChanged so clearing and
+        # refilling them does not schedule a preview rebuild per field (the
+        # caller refreshes the preview once)
+        with _signals_blocked(*self.apm_form_fields):
+            payload = apm_data.get("payload", {})
+        
+            # Clear all fields first
+            for field in self.apm_form_fields:
+                field.clear()
+        
+            # Apply payment data if it exists
+            payment_data = payload.get("payment", {})
+            if payment_data:
+                # Map payment fields to form fields
+                field_mapping = {
+                    "name": "name",
+                    "email": "email", 
+                    "phone_number": "phone_number",
+                    "country": "country",
+                    "payment_type_code": "payment_type_code",
+                    "currency_code": "currency_code",
+                    "amount_total": "amount_total",
+                    "document": "document"
+                }
             
-            for payload_key, field_name in field_mapping.items():
-                if payload_key in payment_data:
-                    field = self._find_field_by_name(field_name)
-                    if field:
-                        field.setText(str(payment_data[payload_key]))
-        else:
-            # Direct payload fields (like NG Bank Transfer)
-            field_mapping = {
-                "name": "name",
-                "email": "email",
-                "country": "country", 
-                "payment_type_code": "payment_type_code",
-                "currency_code": "currency_code",
-                "amount": "amount_total",
-                "redirect_url": "redirect_url",
-                "sub_acc_code": "sub_acc_code",
-                "sub_acc_image_url": "sub_acc_image_url",
-                "instalments": "instalments"
-            }
+                for payload_key, field_name in field_mapping.items():
+                    if payload_key in payment_data:
+                        field = self._find_field_by_name(field_name)
+                        if field:
+                            field.setText(str(payment_data[payload_key]))
+            else:
+                # Direct payload fields (like NG Bank Transfer)
+                field_mapping = {
+                    "name": "name",
+                    "email": "email",
+                    "country": "country", 
+                    "payment_type_code": "payment_type_code",
+                    "currency_code": "currency_code",
+                    "amount": "amount_total",
+                    "redirect_url": "redirect_url",
+                    "sub_acc_code": "sub_acc_code",
+                    "sub_acc_image_url": "sub_acc_image_url",
+                    "instalments": "instalments"
+                }
             
-            for payload_key, field_name in field_mapping.items():
-                if payload_key in payload:
-                    field = self._find_field_by_name(field_name)
-                    if field:
-                        field.setText(str(payload[payload_key]))
-        
+                for payload_key, field_name in field_mapping.items():
+                    if payload_key in payload:
+                        field = self._find_field_by_name(field_name)
+                        if field:
+                            field.setText(str(payload[payload_key]))
+
         # Show/hide additional fields based on what's populated
         self._update_additional_fields_visibility()
 
@@ -2370,8 +3203,9 @@ class TesterWindow(QMainWindow):
 
     def update_payload_preview_apm(self):
         """Update payload preview for APM tab."""
-        if self._syncing:
-            return
+        # Any debounced preview/payload sync is superseded by this rebuild
+        self._preview_timer_apm.stop()
+        self._payload_parse_timer_apm.stop()
 
         country, payment_method, profile_name, apm_data = self.current_apm_data()
         if not apm_data:
@@ -2387,90 +3221,95 @@ class TesterWindow(QMainWindow):
         payload = self.build_payload_apm(country, payment_method, profile_name, apm_data, form_data)
         
         # Update payload editor
-        self._syncing = True
-        self.payload_edit_apm.set_json_text(payload)
-        self._syncing = False
+        with _signals_blocked(self.payload_edit_apm):
+            self.payload_edit_apm.set_json_text(payload)
 
     def on_apm_field_changed(self):
         """Handle APM form field changes."""
-        self.update_payload_preview_apm()
+        self._preview_timer_apm.start()
+
+    def _flush_pending_sync_apm(self):
+        """Apply any debounced APM form/payload sync before the payload is read."""
+        if self._payload_parse_timer_apm.isActive():
+            self._payload_parse_timer_apm.stop()
+            self._do_payload_sync_apm()
+        if self._preview_timer_apm.isActive():
+            self.update_payload_preview_apm()
 
     def on_payload_changed_apm(self):
+        """Schedule an APM payload -> form sync once the user pauses typing."""
+        self._payload_parse_timer_apm.start()
+
+    def _do_payload_sync_apm(self):
         """Keep APM form fields and API key in sync when the payload editor changes.
 
-        We attempt to parse the JSON on each change. On valid JSON we extract
+        We attempt to parse the JSON after each (debounced) edit. On valid JSON we extract
         the payment data and update form fields. We also sync the integration_key
         from the payload to the UI field. This direction-of-sync ensures
         that manual edits in the JSON view are reflected back in the APM
         form fields and API key field.
         """
-        if self._syncing:
-            return
-
-        data = self.payload_edit_apm.get_json_data()
+        data = self.payload_edit_apm.json_data_if_changed()
         if not data:
-            return  # Invalid / incomplete JSON – ignore until valid
+            return  # Invalid / incomplete JSON, or already synced – ignore
 
-        self._syncing = True
-        
-        # Update APM form fields based on payload structure
-        try:
-            # Check if this is a payment-nested structure or direct structure
-            if "payment" in data:
-                # Payment-nested structure (like MPESA, Ozow)
-                payment_data = data["payment"]
+        with _signals_blocked(*self.apm_form_fields, self.key_edit):
+            # Update APM form fields based on payload structure
+            try:
+                # Check if this is a payment-nested structure or direct structure
+                if "payment" in data:
+                    # Payment-nested structure (like MPESA, Ozow)
+                    payment_data = data["payment"]
                 
-                # Map payload fields to form fields
-                field_mapping = {
-                    "name": "name",
-                    "email": "email",
-                    "phone_number": "phone_number",
-                    "country": "country",
-                    "payment_type_code": "payment_type_code",
-                    "currency_code": "currency_code",
-                    "amount_total": "amount_total",
-                    "document": "document"
-                }
+                    # Map payload fields to form fields
+                    field_mapping = {
+                        "name": "name",
+                        "email": "email",
+                        "phone_number": "phone_number",
+                        "country": "country",
+                        "payment_type_code": "payment_type_code",
+                        "currency_code": "currency_code",
+                        "amount_total": "amount_total",
+                        "document": "document"
+                    }
                 
-                for payload_key, field_name in field_mapping.items():
-                    if payload_key in payment_data:
-                        field = self._find_field_by_name(field_name)
-                        if field:
-                            field.setText(str(payment_data[payload_key]))
-            else:
-                # Direct structure (like NG Bank Transfer)
-                field_mapping = {
-                    "name": "name",
-                    "email": "email",
-                    "country": "country",
-                    "payment_type_code": "payment_type_code",
-                    "currency_code": "currency_code",
-                    "amount": "amount_total",
-                    "redirect_url": "redirect_url",
-                    "sub_acc_code": "sub_acc_code",
-                    "sub_acc_image_url": "sub_acc_image_url",
-                    "instalments": "instalments"
-                }
+                    for payload_key, field_name in field_mapping.items():
+                        if payload_key in payment_data:
+                            field = self._find_field_by_name(field_name)
+                            if field:
+                                field.setText(str(payment_data[payload_key]))
+                else:
+                    # Direct structure (like NG Bank Transfer)
+                    field_mapping = {
+                        "name": "name",
+                        "email": "email",
+                        "country": "country",
+                        "payment_type_code": "payment_type_code",
+                        "currency_code": "currency_code",
+                        "amount": "amount_total",
+                        "redirect_url": "redirect_url",
+                        "sub_acc_code": "sub_acc_code",
+                        "sub_acc_image_url": "sub_acc_image_url",
+                        "instalments": "instalments"
+                    }
                 
-                for payload_key, field_name in field_mapping.items():
-                    if payload_key in data:
-                        field = self._find_field_by_name(field_name)
-                        if field:
-                            field.setText(str(data[payload_key]))
+                    for payload_key, field_name in field_mapping.items():
+                        if payload_key in data:
+                            field = self._find_field_by_name(field_name)
+                            if field:
+                                field.setText(str(data[payload_key]))
             
-            # Update additional fields visibility
-            self._update_additional_fields_visibility()
+                # Update additional fields visibility
+                self._update_additional_fields_visibility()
             
-        except (KeyError, TypeError):
-            pass  # Payment data not available or structure unexpected
-        
-        # Update API key field if present in payload
-        if "integration_key" in data:
-            api_key = data["integration_key"]
-            if api_key and api_key != "{integration_key}":
-                self.key_edit.setText(str(api_key))
+            except (KeyError, TypeError):
+                pass  # Payment data not available or structure unexpected
         
-        self._syncing = False
+            # Update API key field if present in payload
+            if "integration_key" in data:
+                api_key = data["integration_key"]
+                if api_key and api_key != "{integration_key}":
+                    self.key_edit.setText(str(api_key))
 
     def format_payload_json_apm(self):
         """Format JSON in APM payload editor."""
@@ -2483,7 +3322,8 @@ class TesterWindow(QMainWindow):
     def build_payload_apm(self, country: str, payment_method: str, profile_name: str, apm_data: Dict, form_data: Dict):
         """Build payload for APM based on current form data and APM structure."""
         # Start with the original payload structure
-        payload = copy.deepcopy(apm_data.get("payload", {}))
+        template = apm_data.get("payload")
+        payload = self._clone_custom_payload(template) if template else {}
         
         # Update integration key from UI
         payload["integration_key"] = self.key_edit.text().strip()
@@ -2531,6 +3371,7 @@ class TesterWindow(QMainWindow):
 
     def run_test_apm(self):
         """Run API test for APM."""
+        self._flush_pending_sync_apm()
         country, payment_method, profile_name, apm_data = self.current_apm_data()
         if not apm_data:
             QMessageBox.warning(self, "No APM Selected", "Please select an APM profile.")
@@ -2566,93 +3407,61 @@ class TesterWindow(QMainWindow):
         }
         
         # Log the API call
-        self.logger.info(f"APM API call - URL: {url}")
-        self.logger.info(f"APM API call - Headers: {headers}")
-        self.logger.info(f"APM API call - Payload: {payload}")
+        self.logger.info("APM API call - URL: %s", url)
+        self.logger.info("APM API call - Headers: %s", headers)
+        self.logger.info("APM API call - Payload: %s", payload)
 
-        # ------------------------------------------------------------------
-        # Observability – show the cURL command first
-        # ------------------------------------------------------------------
-        curl_cmd = self._build_curl_command_apm(base_url, ptp, payload)
-
-        # Show cURL preview and waiting message
-        self.response_edit_apm.appendPlainText("🔧 cURL Command:\n")
-        self.response_edit_apm.appendPlainText(curl_cmd)
-        self.response_edit_apm.appendPlainText("\n\n⏳ Waiting for response...\n")
-        QApplication.processEvents()
-
-        # Prepare header that will be shown once the response is available
-        request_info = (
-            f"🌐 POST {url}\n"
-            f"📋 PTP: {ptp}\n"
-            f"💳 APM: {country} - {payment_method} - {profile_name}\n"
-            f"⏰ {datetime.now().strftime('%H:%M:%S')}\n"
-            + "─" * 50 + "\n"
-        )
+        # Serialize once: the same compact JSON feeds the cURL preview and the request body
+        body = _json_dumpb(payload)
+
+        # Remember what the header shown with a non-JSON/error response needs;
+        # it is only formatted if one of those paths actually uses it
+        request_ctx = (url, ptp, f"💳 APM: {country} - {payment_method} - {profile_name}\n", datetime.now())
  
-        # Create a worker and a QThread to run the network request without blocking the UI
-        self._api_thread_apm = QThread(self)  # Keep reference as attribute
-        worker = APICallWorker(url, payload, headers)
-        worker.moveToThread(self._api_thread_apm)
-        self._api_worker_apm = worker  # Prevent garbage collection
-
-        # Wire up signals
-        self._api_thread_apm.started.connect(worker.run)
-        worker.finished.connect(self._handle_api_response_apm)
-        worker.error.connect(self._handle_api_error_apm)
-
-        # Ensure thread stops/cleans up
-        worker.finished.connect(self._api_thread_apm.quit)
-        worker.error.connect(self._api_thread_apm.quit)
-        self._api_thread_apm.finished.connect(worker.deleteLater)
-        self._api_thread_apm.finished.connect(self._api_thread_apm.deleteLater)
-
-        # Persist request info for handlers
-        self._latest_request_info_apm = request_info
+        # Run the network request on a pooled thread without blocking the UI
+        worker = APICallWorker(url, body, headers,
+                               pretty=self.pretty_response_checkbox.isChecked())
+        worker.signals.finished.connect(self._handle_api_response_apm)
+        worker.signals.error.connect(self._handle_api_error_apm)
+        self._api_worker_apm = worker  # Prevent garbage collection until handled
+
+        # Persist request context for handlers
+        self._latest_request_ctx_apm = request_ctx
+
+        # Render the cURL preview once control is back in the event loop,
+        # while the request is already in flight. Queued before the worker
+        # starts so it always lands ahead of the response.
+        QTimer.singleShot(0, lambda: self._show_request_preview(
+            self.response_edit_apm, self._build_curl_command_apm(base_url, ptp, body.decode("utf-8"))))
 
         # Start the background job
-        self._api_thread_apm.start()
+        QThreadPool.globalInstance().start(worker)
 
-    def _build_curl_command_apm(self, url: str, ptp: str, payload) -> str:
-        """Build cURL command for APM API call."""
-        import json
-        payload_json = json.dumps(payload, indent=2)
+    def _build_curl_command_apm(self, url: str, ptp: str, body: str) -> str:
+        """Build cURL command for APM API call from the serialized request *body*."""
+        payload_json = shlex.quote(body)
         return f"""curl -X POST "{url}/ws/direct" \\
   -H "Content-Type: application/json" \\
   -H "X-EBANX-Custom-Payment-Type-Profile: {ptp}" \\
-  -d '{payload_json}'"""
+  -d {payload_json}"""
 
-    def _handle_api_response_apm(self, resp):
+    def _handle_api_response_apm(self, resp, body: ResponseBody):
         """Handle API response for APM."""
-        self.logger.info(f"APM API response received: {resp.status_code} {resp.reason}")
-        
-        # Append response header below the existing cURL preview so it's not lost
-        self.response_edit_apm.appendPlainText("\n" + self._latest_request_info_apm)
+        self.logger.info("APM API response received: %s %s", resp.status_code, resp.reason)
         
         # Enhanced response display with status color coding
-        status_text = f"📊 Status: {resp.status_code} {resp.reason}\n"
-        if resp.status_code >= 200 and resp.status_code < 300:
-            status_text += "✅ Success\n"
-            self.logger.info("APM API call successful")
-        elif resp.status_code >= 400 and resp.status_code < 500:
-            status_text += "❌ Client Error\n"
-            self.logger.warning(f"APM API client error: {resp.status_code}")
-        elif resp.status_code >= 500:
-            status_text += "🔥 Server Error\n"
-            self.logger.error(f"APM API server error: {resp.status_code}")
-        else:
-            status_text += "⚠️  Other Status\n"
-            self.logger.warning(f"APM API unexpected status: {resp.status_code}")
-        
-        self.response_edit_apm.appendPlainText(status_text)
+        status_text = self._status_text(resp, "APM API")
         
-        try:
-            response_data = resp.json()
-            self.response_edit_apm.appendPlainText("📄 Response Body:\n")
-            self.response_edit_apm.set_json_text(response_data)
-        except ValueError:
-            self.response_edit_apm.appendPlainText("📄 Response Text:\n")
-            self.response_edit_apm.appendPlainText(resp.text)
+        # The body was already parsed and formatted by the worker. Each editor
+        # update is a single call so the editor is laid out/repainted once.
+        if body.is_json:
+            # The formatted body replaces the editor contents
+            self.response_edit_apm.setPlainText(body.text)
+        else:
+            # Append response header below the existing cURL preview so it's not lost
+            self.response_edit_apm.appendPlainText("\n".join((
+                "\n" + _format_request_info(self._latest_request_ctx_apm), status_text, "📄 Response Text:\n", body.text,
+            )))
                 
         self.test_btn_apm.setEnabled(True)
         self.test_btn_apm.setText("Run Test")
@@ -2661,33 +3470,36 @@ class TesterWindow(QMainWindow):
 
     def _handle_api_error_apm(self, error_msg: str):
         """Handle API error for APM."""
-        self.logger.error(f"APM API call failed: {error_msg}")
+        self.logger.error("APM API call failed: %s", error_msg)
         
         # Append error information below preview
-        self.response_edit_apm.appendPlainText("\n" + self._latest_request_info_apm)
-        self.response_edit_apm.appendPlainText(f"❌ Error: {error_msg}")
+        self.response_edit_apm.appendPlainText(f"\n{_format_request_info(self._latest_request_ctx_apm)}\n❌ Error: {error_msg}")
         self.test_btn_apm.setEnabled(True)
         self.test_btn_apm.setText("Run Test")
         # Persist latest settings
         self._persist_settings()
 
     def update_ptp_filter_apm(self, text: str):
+        """Schedule re-filtering of the APM PTP combo once the user pauses typing."""
+        self._ptp_filter_timers["_apm"].start()
+
+    def _apply_ptp_filter_apm(self):
         """Update PTP filter for APM tab."""
-        self.ptp_combo_apm.clear()
-        
-        if text.strip():
-            filtered_ptps = [ptp for ptp in self.ptp_list if text.lower() in ptp.lower()]
-            self.ptp_combo_apm.addItems(filtered_ptps)
-        else:
-            self.ptp_combo_apm.addItems(self.ptp_list)
+        text = self.ptp_filter_apm.text()
+        self._ptp_proxy_apm.setFilterFixedString(text.strip())
+        if self.ptp_combo_apm.count():
+            self.ptp_combo_apm.setCurrentIndex(0)
         
         # Restore last selected PTP if it's in the filtered list
         last_ptp = self.cfg.get("last_ptp_apm", "")
-        if last_ptp and last_ptp in [self.ptp_combo_apm.itemText(i) for i in range(self.ptp_combo_apm.count())]:
-            self.ptp_combo_apm.setCurrentText(last_ptp)
+        if last_ptp:
+            idx = self.ptp_combo_apm.findText(last_ptp)
+            if idx >= 0:
+                self.ptp_combo_apm.setCurrentIndex(idx)
 
     def save_existing_apm(self):
         """Save changes to existing APM."""
+        self._flush_pending_sync_apm()
         country, payment_method, profile_name, apm_data = self.current_apm_data()
         if not apm_data:
             QMessageBox.warning(self, "No APM Selected", "Please select an APM to save.")
@@ -2698,17 +3510,17 @@ class TesterWindow(QMainWindow):
             payload = self.payload_edit_apm.get_json_data()
             
             # Update the APM data
-            self.apm_data[country][payment_method][profile_name]["payload"] = payload
+            self._store_custom_payload(self.apm_data[country][payment_method][profile_name], "payload", payload)
             
             # Write to file
             self._write_apms_file()
             
             QMessageBox.information(self, "APM Saved", f"APM '{profile_name}' saved successfully.")
-            self.logger.info(f"APM saved: {country} - {payment_method} - {profile_name}")
+            self.logger.info("APM saved: %s - %s - %s", country, payment_method, profile_name)
             
         except Exception as exc:
             QMessageBox.critical(self, "Save Error", f"Failed to save APM: {exc}")
-            self.logger.error(f"Failed to save APM: {exc}")
+            self.logger.error("Failed to save APM: %s", exc)
 
     def save_new_apm(self):
         """Add new APM profile."""
@@ -2771,7 +3583,7 @@ class TesterWindow(QMainWindow):
             self.apm_combo.setCurrentIndex(idx)
         
         QMessageBox.information(self, "APM Added", f"New APM '{profile_name}' added successfully.")
-        self.logger.info(f"New APM added: {country} - {payment_method} - {profile_name}")
+        self.logger.info("New APM added: %s - %s - %s", country, payment_method, profile_name)
 
     def delete_current_apm(self):
         """Delete current APM profile."""
@@ -2804,24 +3616,38 @@ class TesterWindow(QMainWindow):
             self.populate_apm_combo()
             
             QMessageBox.information(self, "APM Deleted", f"APM '{profile_name}' deleted successfully.")
-            self.logger.info(f"APM deleted: {country} - {payment_method} - {profile_name}")
+            self.logger.info("APM deleted: %s - %s - %s", country, payment_method, profile_name)
 
     def reload_apms_from_disk(self):
         """Reload APM data from disk."""
+        # Make sure our own queued saves are on disk first
+        self._file_pool.waitForDone()
         try:
             self.apm_data = load_json(APMS_FILE)
+            self._custom_payload_json.clear()
             self.populate_apm_combo()
             QMessageBox.information(self, "APMs Reloaded", "APM data reloaded from disk successfully.")
             self.logger.info("APM data reloaded from disk")
         except Exception as exc:
             QMessageBox.critical(self, "Reload Error", f"Failed to reload APM data: {exc}")
-            self.logger.error(f"Failed to reload APM data: {exc}")
+            self.logger.error("Failed to reload APM data: %s", exc)
 
     def _write_apms_file(self):
-        """Write APM data to file."""
-        os.makedirs(os.path.dirname(APMS_FILE), exist_ok=True)
-        with open(APMS_FILE, "w", encoding="utf-8") as fh:
-            json.dump(self.apm_data, fh, indent=2)
+        """Persist *self.apm_data* to *APMS_FILE*.
+
+        Kept indented (the APM file is meant to be edited by hand); otherwise
+        written like the cards file – serialized here, atomically replaced on
+        the file pool.
+        """
+        job = FileWriteJob(APMS_FILE, _json_dumpb(self.apm_data, indent=True))
+        job.signals.error.connect(self._on_apms_write_error)
+        job.signals.finished.connect(self._on_file_write_finished)
+        self._pending_writes.add(job)
+        self._file_pool.start(job)
+
+    def _on_apms_write_error(self, error_msg: str):
+        self.logger.error("Could not write APM file: %s", error_msg)
+        QMessageBox.critical(self, "Save error", f"Could not write APM file: {error_msg}")
 
 # ---------------------------------------------------------------------------
 # Entry point
@@ -2834,6 +3660,8 @@ def main():
     
     app = QApplication(sys.argv)
     logger.info("QApplication created")
+    # Release pooled keep-alive connections however the app exits
+    app.aboutToQuit.connect(_close_http_session)
     
     w = TesterWindow()
     logger.info("TesterWindow created")